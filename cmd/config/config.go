@@ -368,8 +368,17 @@ func setCoreCount(cores int, myTarget target.Target, localTempDir string) (strin
 		Script: fmt.Sprintf(`
 desired_core_count_per_socket=%d
 num_cpus=$(ls /sys/devices/system/cpu/ | grep -E "^cpu[0-9]+$" | wc -l)
-num_threads=$(lscpu | grep 'Thread(s) per core' | awk '{print $NF}')
-num_sockets=$(lscpu | grep 'Socket(s)' | awk '{print $NF}')
+# topology of the online CPUs, from sysfs when available, otherwise from lscpu
+package_ids=$(cat /sys/devices/system/cpu/cpu[0-9]*/topology/physical_package_id 2>/dev/null)
+num_online_cpus=$(echo "$package_ids" | grep -c .)
+num_sockets=$(echo "$package_ids" | sort -u | grep -c .)
+num_cores=$(cat /sys/devices/system/cpu/cpu[0-9]*/topology/thread_siblings_list 2>/dev/null | sort -u | grep -c .)
+if [[ $num_cores -gt 0 && $num_sockets -gt 0 ]]; then
+	num_threads=$((num_online_cpus / num_cores))
+else
+	num_threads=$(lscpu | grep 'Thread(s) per core' | awk '{print $NF}')
+	num_sockets=$(lscpu | grep 'Socket(s)' | awk '{print $NF}')
+fi
 num_cores_per_socket=$((num_cpus / num_sockets / num_threads))
 
 # if desired core count is greater than current core count, exit
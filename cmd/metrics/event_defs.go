@@ -52,20 +52,20 @@ func LoadEventGroups(eventDefinitionOverridePath string, metadata Metadata) (gro
 	defer file.Close()
 	scanner := bufio.NewScanner(file)
 	uncollectable := mapset.NewSet[string]()
+	// names of the events listed by perf
+	perfEventNames := parsePerfListEventNames(metadata.PerfSupportedEvents)
 	var group GroupDefinition
 	for scanner.Scan() {
 		line := strings.TrimSpace(scanner.Text())
 		if len(line) == 0 || line[0] == '#' {
 			continue
 		}
+		// abbreviate the event name to shorten the eventual perf stat command line
 		var event EventDefinition
-		if event, err = parseEventDefinition(line[:len(line)-1]); err != nil {
+		if event, err = parseEventDefinition(abbreviateEventName(line[:len(line)-1])); err != nil {
 			return
 		}
-		// abbreviate the event name to shorten the eventual perf stat command line
-		event.Name = abbreviateEventName(event.Name)
-		event.Raw = abbreviateEventName(event.Raw)
-		if isCollectableEvent(event, metadata) {
+		if isCollectableEvent(event, metadata, perfEventNames) {
 			group = append(group, event)
 		} else {
 			uncollectable.Add(event.Name)
@@ -93,40 +93,60 @@ func LoadEventGroups(eventDefinitionOverridePath string, metadata Metadata) (gro
 	return
 }
 
+// eventNameAbbreviations - applied in order by abbreviateEventName.
+// Abbreviations must be unique and in order. And, if replacing UNC_*, the abbreviation must begin with "UNC" because this is how we identify uncore events when collapsing them.
+var eventNameAbbreviations = [][]string{
+	{"UNC_CHA_TOR_INSERTS", "UNCCTI"},
+	{"UNC_CHA_TOR_OCCUPANCY", "UNCCTO"},
+	{"UNC_CHA_CLOCKTICKS", "UNCCCT"},
+	{"UNC_M_CAS_COUNT_SCH", "UNCMCC"},
+	{"IA_MISS_DRD_REMOTE", "IMDR"},
+	{"IA_MISS_DRD_LOCAL", "IMDL"},
+	{"IA_MISS_LLCPREFDATA", "IMLP"},
+	{"IA_MISS_LLCPREFRFO", "IMLR"},
+	{"IA_MISS_DRD_PREF_LOCAL", "IMDPL"},
+	{"IA_MISS_DRD_PREF_REMOTE", "IMDRP"},
+	{"IA_MISS_CRD_PREF", "IMCP"},
+	{"IA_MISS_RFO_PREF", "IMRP"},
+	{"IA_MISS_RFO", "IMRF"},
+	{"IA_MISS_CRD", "IMC"},
+	{"IA_MISS_DRD", "IMD"},
+	{"IO_PCIRDCUR", "IPCI"},
+	{"IO_ITOMCACHENEAR", "IITN"},
+	{"IO_ITOM", "IITO"},
+	{"IMD_OPT", "IMDO"},
+}
+
 // abbreviateEventName replaces long event names with abbreviations to reduce the length of the perf command.
 // focus is on uncore events because they are repeated for each uncore device
 func abbreviateEventName(event string) string {
-	// Abbreviations must be unique and in order. And, if replacing UNC_*, the abbreviation must begin with "UNC" because this is how we identify uncore events when collapsing them.
-	var abbreviations = [][]string{
-		{"UNC_CHA_TOR_INSERTS", "UNCCTI"},
-		{"UNC_CHA_TOR_OCCUPANCY", "UNCCTO"},
-		{"UNC_CHA_CLOCKTICKS", "UNCCCT"},
-		{"UNC_M_CAS_COUNT_SCH", "UNCMCC"},
-		{"IA_MISS_DRD_REMOTE", "IMDR"},
-		{"IA_MISS_DRD_LOCAL", "IMDL"},
-		{"IA_MISS_LLCPREFDATA", "IMLP"},
-		{"IA_MISS_LLCPREFRFO", "IMLR"},
-		{"IA_MISS_DRD_PREF_LOCAL", "IMDPL"},
-		{"IA_MISS_DRD_PREF_REMOTE", "IMDRP"},
-		{"IA_MISS_CRD_PREF", "IMCP"},
-		{"IA_MISS_RFO_PREF", "IMRP"},
-		{"IA_MISS_RFO", "IMRF"},
-		{"IA_MISS_CRD", "IMC"},
-		{"IA_MISS_DRD", "IMD"},
-		{"IO_PCIRDCUR", "IPCI"},
-		{"IO_ITOMCACHENEAR", "IITN"},
-		{"IO_ITOM", "IITO"},
-		{"IMD_OPT", "IMDO"},
-	}
 	// if an abbreviation key is found in the event, replace the matching portion of the event with the abbreviation
-	for _, abbr := range abbreviations {
+	for _, abbr := range eventNameAbbreviations {
 		event = strings.Replace(event, abbr[0], abbr[1], -1)
 	}
 	return event
 }
 
+// parsePerfListEventNames returns the set of event names found in perf list output, e.g.,
+// "  cpu-cycles OR cycles    [Hardware event]" adds cpu-cycles and cycles
+func parsePerfListEventNames(perfList string) mapset.Set[string] {
+	names := mapset.NewSet[string]()
+	for _, line := range strings.Split(perfList, "\n") {
+		for _, field := range strings.Fields(line) {
+			// the event type, e.g., [Kernel PMU event], follows the names
+			if strings.HasPrefix(field, "[") {
+				break
+			}
+			if field != "OR" {
+				names.Add(field)
+			}
+		}
+	}
+	return names
+}
+
 // isCollectableEvent confirms if given event can be collected on the platform
-func isCollectableEvent(event EventDefinition, metadata Metadata) bool {
+func isCollectableEvent(event EventDefinition, metadata Metadata, perfEventNames mapset.Set[string]) bool {
 	// fixed-counter TMA
 	if !metadata.SupportsFixedTMA && (event.Name == "TOPDOWN.SLOTS" || strings.HasPrefix(event.Name, "PERF_METRICS.")) {
 		slog.Debug("Fixed counter TMA not supported on target", slog.String("event", event.Name))
@@ -166,14 +186,7 @@ func isCollectableEvent(event EventDefinition, metadata Metadata) bool {
 			slog.Debug("Uncore events not supported in process or cgroup scope", slog.String("event", event.Name))
 			return false
 		}
-		deviceExists := false
-		for uncoreDeviceName := range metadata.UncoreDeviceIDs {
-			if event.Device == uncoreDeviceName {
-				deviceExists = true
-				break
-			}
-		}
-		if !deviceExists {
+		if _, deviceExists := metadata.UncoreDeviceIDs[event.Device]; !deviceExists {
 			slog.Debug("Uncore device not found", slog.String("device", event.Device))
 			return false
 		} else if !strings.Contains(event.Raw, "umask") && !strings.Contains(event.Raw, "event") {
@@ -195,8 +208,8 @@ func isCollectableEvent(event EventDefinition, metadata Metadata) bool {
 		return false
 	}
 	// finally, if it isn't in the perf list output, it isn't collectable
-	name := strings.Split(event.Name, ":")[0]
-	if !strings.Contains(metadata.PerfSupportedEvents, name) {
+	name, _, _ := strings.Cut(event.Name, ":")
+	if !perfEventNames.Contains(name) {
 		slog.Debug("Event not supported by perf", slog.String("event", name))
 		return false
 	}
@@ -206,31 +219,36 @@ func isCollectableEvent(event EventDefinition, metadata Metadata) bool {
 // parseEventDefinition parses one line from the event definition file into a representative structure
 func parseEventDefinition(line string) (eventDef EventDefinition, err error) {
 	eventDef.Raw = line
-	fields := strings.Split(line, ",")
-	if len(fields) == 1 {
-		eventDef.Name = fields[0]
-	} else if len(fields) > 1 {
-		nameField := fields[len(fields)-1]
-		if nameField[:5] != "name=" {
-			err = fmt.Errorf("unrecognized event format, name field not found: %s", line)
-			return
-		}
-		eventDef.Name = nameField[6 : len(nameField)-2]
-		eventDef.Device = strings.Split(fields[0], "/")[0]
-	} else {
-		err = fmt.Errorf("unrecognized event format: %s", line)
+	// only the first and last comma separated fields are needed
+	lastComma := strings.LastIndex(line, ",")
+	if lastComma == -1 {
+		eventDef.Name = line
+		return
+	}
+	nameField := line[lastComma+1:]
+	if !strings.HasPrefix(nameField, "name=") {
+		err = fmt.Errorf("unrecognized event format, name field not found: %s", line)
 		return
 	}
+	eventDef.Name = nameField[6 : len(nameField)-2]
+	firstField, _, _ := strings.Cut(line, ",")
+	eventDef.Device, _, _ = strings.Cut(firstField, "/")
 	return
 }
 
+// example 1: cha/event=0x35,umask=0xc80ffe01,name='UNC_CHA_TOR_INSERTS.IA_MISS_CRD'/,
+// expand to: uncore_cha_0/event=0x35,umask=0xc80ffe01,name='UNC_CHA_TOR_INSERTS.IA_MISS_CRD.0'/,
+// example 2: cha/event=0x36,umask=0x21,config1=0x4043300000000,name='UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433'/
+// expand to: uncore_cha_0/event=0x36,umask=0x21,config1=0x4043300000000,name='UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433'/
+var uncoreEventRegex = regexp.MustCompile(`(\w+)/event=(0x[0-9,a-f,A-F]+),umask=(0x[0-9,a-f,A-F]+.*),name='(.*)'`)
+
 // expandUncoreGroup expands a perf event group into a list of groups where each group is
 // associated with an uncore device
-func expandUncoreGroup(group GroupDefinition, ids []int, re *regexp.Regexp) (groups []GroupDefinition, err error) {
+func expandUncoreGroup(group GroupDefinition, ids []int) (groups []GroupDefinition, err error) {
 	for _, deviceID := range ids {
 		var newGroup GroupDefinition
 		for _, event := range group {
-			match := re.FindStringSubmatch(event.Raw)
+			match := uncoreEventRegex.FindStringSubmatch(event.Raw)
 			if len(match) == 0 {
 				err = fmt.Errorf("unexpected raw event format: %s", event.Raw)
 				return
@@ -249,24 +267,15 @@ func expandUncoreGroup(group GroupDefinition, ids []int, re *regexp.Regexp) (gro
 // expandUncoreGroups expands groups with uncore events to include events for all uncore devices
 // assumes that uncore device events are in their own groups, not mixed with other device types
 func expandUncoreGroups(groups []GroupDefinition, metadata Metadata) (expandedGroups []GroupDefinition, err error) {
-	// example 1: cha/event=0x35,umask=0xc80ffe01,name='UNC_CHA_TOR_INSERTS.IA_MISS_CRD'/,
-	// expand to: uncore_cha_0/event=0x35,umask=0xc80ffe01,name='UNC_CHA_TOR_INSERTS.IA_MISS_CRD.0'/,
-	// example 2: cha/event=0x36,umask=0x21,config1=0x4043300000000,name='UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433'/
-	// expand to: uncore_cha_0/event=0x36,umask=0x21,config1=0x4043300000000,name='UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433'/
-	re := regexp.MustCompile(`(\w+)/event=(0x[0-9,a-f,A-F]+),umask=(0x[0-9,a-f,A-F]+.*),name='(.*)'`)
-	var deviceTypes []string
-	for deviceType := range metadata.UncoreDeviceIDs {
-		deviceTypes = append(deviceTypes, deviceType)
-	}
 	for _, group := range groups {
 		device := group[0].Device
-		if util.StringInList(device, deviceTypes) {
+		if deviceIDs, ok := metadata.UncoreDeviceIDs[device]; ok {
 			var newGroups []GroupDefinition
-			if len(metadata.UncoreDeviceIDs[device]) == 0 {
+			if len(deviceIDs) == 0 {
 				slog.Warn("No uncore devices found", slog.String("type", device))
 				continue
 			}
-			if newGroups, err = expandUncoreGroup(group, metadata.UncoreDeviceIDs[device], re); err != nil {
+			if newGroups, err = expandUncoreGroup(group, deviceIDs); err != nil {
 				return
 			}
 			expandedGroups = append(expandedGroups, newGroups...)
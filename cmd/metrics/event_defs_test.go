@@ -0,0 +1,100 @@
+package metrics
+
+// Copyright (C) 2021-2024 Intel Corporation
+// SPDX-License-Identifier: BSD-3-Clause
+
+import "testing"
+
+// excerpt of 'perf list --no-desc' output
+const perfListOutput = `
+List of pre-defined events (to be used in -e or -M):
+
+  branch-instructions OR branches                    [Hardware event]
+  cpu-cycles OR cycles                               [Hardware event]
+  instructions                                       [Hardware event]
+  ref-cycles                                         [Hardware event]
+  cpu-clock                                          [Software event]
+  L1-dcache-loads OR cpu/L1-dcache-loads/            [Hardware cache event]
+  cstate_core/c6-residency/                          [Kernel PMU event]
+  cstate_pkg/c6-residency/                           [Kernel PMU event]
+  power/energy-pkg/                                  [Kernel PMU event]
+  power/energy-ram/                                  [Kernel PMU event]
+  uncore_imc_0/cas_count_read/                       [Kernel PMU event]
+  uncore_imc_0/cas_count_write/                      [Kernel PMU event]
+  msr/tsc/                                           [Kernel PMU event]
+  mem:<addr>[/len][:access]                          [Hardware breakpoint]
+  sched:sched_switch                                 [Tracepoint event]
+`
+
+func TestParsePerfListEventNames(t *testing.T) {
+	names := parsePerfListEventNames(perfListOutput)
+	tests := []struct {
+		name     string
+		expected bool
+	}{
+		// both sides of OR aliases
+		{"branch-instructions", true},
+		{"branches", true},
+		{"cpu-cycles", true},
+		{"cycles", true},
+		{"L1-dcache-loads", true},
+		{"cpu/L1-dcache-loads/", true},
+		{"instructions", true},
+		{"ref-cycles", true},
+		// cstate and power events as named in the event files
+		{"cstate_core/c6-residency/", true},
+		{"cstate_pkg/c6-residency/", true},
+		{"power/energy-pkg/", true},
+		{"power/energy-ram/", true},
+		// uncore events
+		{"uncore_imc_0/cas_count_read/", true},
+		{"uncore_imc_0/cas_count_write/", true},
+		{"sched:sched_switch", true},
+		// the OR separator and event types are not names
+		{"OR", false},
+		{"[Hardware", false},
+		{"event]", false},
+		{"[Kernel", false},
+		// names must match exactly, not as a substring of another name
+		{"energy-pkg", false},
+		{"power/energy-gpu/", false},
+		{"uncore_imc_1/cas_count_read/", false},
+		{"c6-residency", false},
+		{"instruction", false},
+	}
+	for _, test := range tests {
+		if names.Contains(test.name) != test.expected {
+			t.Errorf("expected %t for %s", test.expected, test.name)
+		}
+	}
+}
+
+func TestIsCollectableEventPerfList(t *testing.T) {
+	names := parsePerfListEventNames(perfListOutput)
+	metadata := Metadata{SupportsRefCycles: true}
+	tests := []struct {
+		line     string
+		expected bool
+	}{
+		{"cpu-cycles,", true},
+		{"cpu-cycles:k,", true},
+		{"instructions;", true},
+		{"instructions:k;", true},
+		{"ref-cycles:k,", true},
+		{"cstate_core/c6-residency/;", true},
+		{"cstate_pkg/c6-residency/;", true},
+		{"power/energy-pkg/,", true},
+		{"power/energy-ram/;", true},
+		{"cstate_core/c7-residency/;", false},
+		{"power/energy-psys/,", false},
+	}
+	for _, test := range tests {
+		event, err := parseEventDefinition(test.line[:len(test.line)-1])
+		if err != nil {
+			t.Fatalf("failed to parse event definition: %v", err)
+		}
+		if isCollectableEvent(event, metadata, names) != test.expected {
+			t.Errorf("expected %t for %s", test.expected, test.line)
+		}
+	}
+}
@@ -309,29 +309,30 @@ func collapseUncoreGroupsInFrame(inFrame EventFrame) (outFrame EventFrame, err e
 	return
 }
 
+// trimEventIDSuffix - removes the .ID suffix from an event name, e.g., UNCCTI.IA_MISS.3 -> UNCCTI.IA_MISS
+func trimEventIDSuffix(name string) string {
+	if idx := strings.LastIndex(name, "."); idx >= 0 {
+		return name[:idx]
+	}
+	return ""
+}
+
 // isMatchingGroup - groups are considered matching if they include the same event names (ignoring .ID suffix)
 func isMatchingGroup(groupA, groupB EventGroup) bool {
 	if len(groupA.EventValues) != len(groupB.EventValues) {
 		return false
 	}
-	aNames := make([]string, 0, len(groupA.EventValues))
-	bNames := make([]string, 0, len(groupB.EventValues))
+	// count the names in A and remove the names in B
+	nameCounts := make(map[string]int, len(groupA.EventValues))
 	for eventAName := range groupA.EventValues {
-		parts := strings.Split(eventAName, ".")
-		newName := strings.Join(parts[:len(parts)-1], ".")
-		aNames = append(aNames, newName)
+		nameCounts[trimEventIDSuffix(eventAName)]++
 	}
 	for eventBName := range groupB.EventValues {
-		parts := strings.Split(eventBName, ".")
-		newName := strings.Join(parts[:len(parts)-1], ".")
-		bNames = append(bNames, newName)
-	}
-	slices.Sort(aNames)
-	slices.Sort(bNames)
-	for nameIdx, name := range aNames {
-		if name != bNames[nameIdx] {
+		name := trimEventIDSuffix(eventBName)
+		if nameCounts[name] == 0 {
 			return false
 		}
+		nameCounts[name]--
 	}
 	return true
 }
@@ -343,12 +344,7 @@ func collapseUncoreGroups(inGroups []EventGroup, firstIdx int, count int) (outGr
 	outGroup.EventValues = make(map[string]float64)
 	for i := firstIdx; i <= firstIdx+count; i++ {
 		for name, value := range inGroups[i].EventValues {
-			parts := strings.Split(name, ".")
-			newName := strings.Join(parts[:len(parts)-1], ".")
-			if _, ok := outGroup.EventValues[newName]; !ok {
-				outGroup.EventValues[newName] = 0
-			}
-			outGroup.EventValues[newName] += value
+			outGroup.EventValues[trimEventIDSuffix(name)] += value
 		}
 	}
 	return
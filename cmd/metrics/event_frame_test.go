@@ -0,0 +1,68 @@
+package metrics
+
+// Copyright (C) 2021-2024 Intel Corporation
+// SPDX-License-Identifier: BSD-3-Clause
+
+import "testing"
+
+func TestTrimEventIDSuffix(t *testing.T) {
+	tests := []struct {
+		name     string
+		expected string
+	}{
+		{"UNC_CHA_TOR_INSERTS.IA_MISS.0", "UNC_CHA_TOR_INSERTS.IA_MISS"},
+		{"UNC_CHA_TOR_INSERTS.IA_MISS.12", "UNC_CHA_TOR_INSERTS.IA_MISS"},
+		{"UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433.1", "UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433"},
+		{"UNC_M_CAS_COUNT.RD.1", "UNC_M_CAS_COUNT.RD"},
+		// names without a dot trim to nothing, as they did when splitting on "."
+		{"cpu-cycles:u", ""},
+		{"instructions", ""},
+	}
+	for _, test := range tests {
+		if result := trimEventIDSuffix(test.name); result != test.expected {
+			t.Errorf("expected %q, got %q for %s", test.expected, result, test.name)
+		}
+	}
+}
+
+func TestIsMatchingGroup(t *testing.T) {
+	newGroup := func(names ...string) EventGroup {
+		group := EventGroup{EventValues: make(map[string]float64)}
+		for _, name := range names {
+			group.EventValues[name] = 1
+		}
+		return group
+	}
+	tests := []struct {
+		a        EventGroup
+		b        EventGroup
+		expected bool
+	}{
+		// same events on different uncore devices
+		{newGroup("UNC_CHA_TOR_INSERTS.IA_MISS.0", "UNC_CHA_CLOCKTICKS.0"), newGroup("UNC_CHA_CLOCKTICKS.1", "UNC_CHA_TOR_INSERTS.IA_MISS.1"), true},
+		{newGroup("UNC_CHA_TOR_INSERTS.IA_MISS.0"), newGroup("UNC_CHA_TOR_INSERTS.IA_HIT.0"), false},
+		// duplicate events within a group must match in number, not just by name
+		{newGroup("UNC_M_CAS_COUNT.RD.0", "UNC_M_CAS_COUNT.RD.1", "UNC_M_CAS_COUNT.WR.0"), newGroup("UNC_M_CAS_COUNT.RD.2", "UNC_M_CAS_COUNT.RD.3", "UNC_M_CAS_COUNT.WR.2"), true},
+		{newGroup("UNC_M_CAS_COUNT.RD.0", "UNC_M_CAS_COUNT.RD.1", "UNC_M_CAS_COUNT.WR.0"), newGroup("UNC_M_CAS_COUNT.RD.2", "UNC_M_CAS_COUNT.WR.2", "UNC_M_CAS_COUNT.WR.3"), false},
+		// only the last dot separated field is the ID
+		{newGroup("UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433.0"), newGroup("UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433.1"), true},
+		{newGroup("UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40433.0"), newGroup("UNC_CHA_TOR_OCCUPANCY.IA_MISS.0x40432.0"), false},
+		// names without an ID suffix all trim to the same empty name
+		{newGroup("cpu-cycles:u"), newGroup("instructions:k"), true},
+		{newGroup("cpu-cycles:u", "UNC_CHA_CLOCKTICKS.0"), newGroup("instructions:k", "UNC_CHA_CLOCKTICKS.1"), true},
+		{newGroup("cpu-cycles:u"), newGroup("UNC_CHA_CLOCKTICKS.1"), false},
+		// groups of different sizes that share a prefix
+		{newGroup("UNC_CHA_CLOCKTICKS.0", "UNC_CHA_TOR_INSERTS.IA_MISS.0"), newGroup("UNC_CHA_CLOCKTICKS.1"), false},
+		{newGroup("UNC_CHA_CLOCKTICKS.0"), newGroup("UNC_CHA_CLOCKTICKS.1", "UNC_CHA_TOR_INSERTS.IA_MISS.1"), false},
+		{newGroup("UNC_CHA_TOR_INSERTS.IA_MISS.0"), newGroup("UNC_CHA_TOR_INSERTS.IA_MISS_CRD.0"), false},
+	}
+	for i, test := range tests {
+		if result := isMatchingGroup(test.a, test.b); result != test.expected {
+			t.Errorf("test %d: expected %t, got %t", i, test.expected, result)
+		}
+		// matching is symmetric
+		if result := isMatchingGroup(test.b, test.a); result != test.expected {
+			t.Errorf("test %d (reversed): expected %t, got %t", i, test.expected, result)
+		}
+	}
+}
@@ -31,7 +31,7 @@ type Metadata struct {
 	Vendor                    string
 	Microarchitecture         string
 	ModelName                 string
-	PerfSupportedEvents       string
+	PerfSupportedEvents       string `json:"-"` // large and only used to filter events, so not included in JSON output
 	PMUDriverVersion          string
 	SocketCount               int
 	SupportsInstructions      bool
@@ -52,32 +52,19 @@ type Metadata struct {
 func LoadMetadata(myTarget target.Target, noRoot bool, perfPath string, localTempDir string) (metadata Metadata, err error) {
 	// CPU Info
 	var cpuInfo []map[string]string
-	cpuInfo, err = getCPUInfo(myTarget)
+	cpuInfo, err = getCPUInfo(myTarget, localTempDir)
 	if err != nil || len(cpuInfo) < 1 {
 		err = fmt.Errorf("failed to read cpu info: %v", err)
 		return
 	}
-	// Core Count (per socket)
-	metadata.CoresPerSocket, err = strconv.Atoi(cpuInfo[0]["cpu cores"])
-	if err != nil || metadata.CoresPerSocket == 0 {
-		err = fmt.Errorf("failed to retrieve cores per socket: %v", err)
-		return
-	}
-	// Socket Count
-	var maxPhysicalID int
-	if maxPhysicalID, err = strconv.Atoi(cpuInfo[len(cpuInfo)-1]["physical id"]); err != nil {
-		err = fmt.Errorf("failed to retrieve max physical id: %v", err)
-		return
-	}
-	metadata.SocketCount = maxPhysicalID + 1
-	// Hyperthreading - threads per core
-	if cpuInfo[0]["siblings"] != cpuInfo[0]["cpu cores"] {
-		metadata.ThreadsPerCore = 2
-	} else {
-		metadata.ThreadsPerCore = 1
+	// CPU topology - core count (per socket), socket count, threads per core, and CPU to socket map
+	if metadata.CoresPerSocket, metadata.SocketCount, metadata.ThreadsPerCore, metadata.CPUSocketMap, err = getCPUTopology(myTarget, localTempDir); err != nil {
+		slog.Warn("failed to read CPU topology from sysfs, falling back to cpuinfo", slog.String("error", err.Error()))
+		if metadata.CoresPerSocket, metadata.SocketCount, metadata.ThreadsPerCore, err = getCPUTopologyFromCPUInfo(cpuInfo); err != nil {
+			return
+		}
+		metadata.CPUSocketMap = createCPUSocketMap(metadata.CoresPerSocket, metadata.SocketCount, metadata.ThreadsPerCore == 2)
 	}
-	// CPUSocketMap
-	metadata.CPUSocketMap = createCPUSocketMap(metadata.CoresPerSocket, metadata.SocketCount, metadata.ThreadsPerCore == 2)
 	// Model Name
 	metadata.ModelName = cpuInfo[0]["model name"]
 	// Architecture
@@ -305,8 +292,7 @@ func (md Metadata) String() string {
 }
 
 // JSON converts the Metadata struct to a JSON-encoded byte slice.
-// It creates a copy of the Metadata, sets the PerfSupportedEvents field to an empty string,
-// and then marshals the copy to JSON format.
+// The PerfSupportedEvents field is excluded by its struct tag.
 //
 // Returns:
 // - out: JSON-encoded byte slice representation of the Metadata.
@@ -316,9 +302,6 @@ func (md Metadata) JSON() (out []byte, err error) {
 		slog.Error("failed to marshal metadata structure", slog.String("error", err.Error()))
 		return
 	}
-	// remove PerfSupportedEvents from json
-	re := regexp.MustCompile(`"PerfSupportedEvents":".*?",`)
-	out = re.ReplaceAll(out, []byte(""))
 	return
 }
 
@@ -343,12 +326,15 @@ func (md Metadata) WriteJSONToFile(path string) (err error) {
 	return
 }
 
+// uncoreDeviceRegex - matches uncore device names, e.g., uncore_cha_0, and captures the type and ID
+var uncoreDeviceRegex = regexp.MustCompile(`^(?:uncore_|amd_)(.*)_(\d+)$`)
+
 // getUncoreDeviceIDs - returns a map of device type to list of device indices
 // e.g., "upi" -> [0,1,2,3],
 func getUncoreDeviceIDs(myTarget target.Target, localTempDir string) (IDs map[string][]int, err error) {
 	scriptDef := script.ScriptDefinition{
 		Name:      "list uncore devices",
-		Script:    "find /sys/bus/event_source/devices/ \\( -name uncore_* -o -name amd_* \\)",
+		Script:    "ls /sys/bus/event_source/devices/",
 		Superuser: false,
 	}
 	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
@@ -358,9 +344,8 @@ func getUncoreDeviceIDs(myTarget target.Target, localTempDir string) (IDs map[st
 	}
 	fileNames := strings.Split(scriptOutput.Stdout, "\n")
 	IDs = make(map[string][]int)
-	re := regexp.MustCompile(`(?:uncore_|amd_)(.*)_(\d+)`)
 	for _, fileName := range fileNames {
-		match := re.FindStringSubmatch(fileName)
+		match := uncoreDeviceRegex.FindStringSubmatch(fileName)
 		if match == nil {
 			continue
 		}
@@ -373,35 +358,166 @@ func getUncoreDeviceIDs(myTarget target.Target, localTempDir string) (IDs map[st
 	return
 }
 
-// getCPUInfo - reads and returns all data from /proc/cpuinfo
-func getCPUInfo(myTarget target.Target) (cpuInfo []map[string]string, err error) {
-	cmd := exec.Command("cat", "/proc/cpuinfo")
-	stdout, stderr, exitcode, err := myTarget.RunCommand(cmd, 0, true)
+// getCPUInfo - reads and returns the fields used by LoadMetadata from the first and last
+// CPU entries in /proc/cpuinfo
+func getCPUInfo(myTarget target.Target, localTempDir string) (cpuInfo []map[string]string, err error) {
+	// filter on the target to the used fields of the first and last CPUs
+	scriptDef := script.ScriptDefinition{
+		Name:      "cpuinfo",
+		Script:    `awk '/^(processor|vendor_id|cpu family|model|model name|stepping|physical id|siblings|cpu cores)[ \t]*:/ {cpu = cpu $0 "\n"} /^$/ {if (!printed) {print cpu; printed = 1} last = cpu; cpu = ""} END {if (cpu != "") last = cpu; print last}' /proc/cpuinfo`,
+		Superuser: false,
+	}
+	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
 	if err != nil {
-		err = fmt.Errorf("failed to get cpuinfo: %s, %d, %v", stderr, exitcode, err)
+		err = fmt.Errorf("failed to get cpuinfo: %s, %d, %v", scriptOutput.Stderr, scriptOutput.Exitcode, err)
 		return
 	}
+	stdout := scriptOutput.Stdout
 	oneCPUInfo := make(map[string]string)
 	for _, line := range strings.Split(stdout, "\n") {
-		fields := strings.Split(line, ":")
-		if len(fields) < 2 {
+		// split on the first colon only
+		key, value, found := strings.Cut(line, ":")
+		if !found {
 			if len(oneCPUInfo) > 0 {
 				cpuInfo = append(cpuInfo, oneCPUInfo)
-				oneCPUInfo = make(map[string]string)
+				oneCPUInfo = make(map[string]string, len(oneCPUInfo))
 				continue
 			} else {
 				break
 			}
 		}
-		oneCPUInfo[strings.TrimSpace(fields[0])] = strings.TrimSpace(fields[1])
+		oneCPUInfo[strings.TrimSpace(key)] = strings.TrimSpace(value)
+	}
+	return
+}
+
+// getCPUTopology - reads the package ID and thread sibling list of each online CPU from sysfs in a
+// single command and derives the topology from them
+func getCPUTopology(myTarget target.Target, localTempDir string) (coresPerSocket int, socketCount int, threadsPerCore int, cpuSocketMap map[int]int, err error) {
+	scriptDef := script.ScriptDefinition{
+		Name:      "cpu topology",
+		Script:    "grep -H . /sys/devices/system/cpu/cpu[0-9]*/topology/{physical_package_id,thread_siblings_list}",
+		Superuser: false,
+	}
+	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
+	if err != nil {
+		err = fmt.Errorf("failed to get cpu topology: %s, %d, %v", scriptOutput.Stderr, scriptOutput.Exitcode, err)
+		return
+	}
+	stdout := scriptOutput.Stdout
+	cpuSocketMap = make(map[int]int)
+	// core_id can be relative to the die on multi-die packages, so identify cores by
+	// their (system unique) list of sibling threads instead, e.g., "0,56" or "0-1"
+	cpuSiblingsMap := make(map[int]string)
+	// e.g., /sys/devices/system/cpu/cpu12/topology/physical_package_id:1
+	for _, line := range strings.Split(stdout, "\n") {
+		if line == "" {
+			continue
+		}
+		path, value, found := strings.Cut(line, ":")
+		if !found {
+			continue
+		}
+		pathFields := strings.Split(path, "/")
+		if len(pathFields) != 8 {
+			continue
+		}
+		var cpu int
+		if cpu, err = strconv.Atoi(strings.TrimPrefix(pathFields[5], "cpu")); err != nil {
+			err = fmt.Errorf("failed to parse cpu number from %s: %v", path, err)
+			return
+		}
+		if pathFields[7] == "physical_package_id" {
+			var id int
+			if id, err = strconv.Atoi(value); err != nil {
+				err = fmt.Errorf("failed to parse %s: %v", path, err)
+				return
+			}
+			cpuSocketMap[cpu] = id
+		} else {
+			cpuSiblingsMap[cpu] = value
+		}
+	}
+	if len(cpuSocketMap) == 0 || len(cpuSocketMap) != len(cpuSiblingsMap) {
+		err = fmt.Errorf("incomplete cpu topology in sysfs")
+		return
+	}
+	sockets := make(map[int]bool)
+	cores := make(map[string]bool)
+	for cpu, socket := range cpuSocketMap {
+		sockets[socket] = true
+		cores[cpuSiblingsMap[cpu]] = true
+	}
+	socketCount = len(sockets)
+	// sockets are used as indices into per-socket lists, so they must be numbered 0..N-1
+	for socket := range sockets {
+		if socket >= socketCount {
+			err = fmt.Errorf("non-contiguous physical package ids in sysfs")
+			return
+		}
+	}
+	coresPerSocket = len(cores) / socketCount
+	// use the largest sibling list so that offline SMT siblings on some cores don't hide hyperthreading
+	threadsPerCore = 1
+	for siblings := range cores {
+		var threads int
+		if threads, err = countCPUList(siblings); err != nil {
+			return
+		}
+		threadsPerCore = max(threadsPerCore, threads)
+	}
+	return
+}
+
+// countCPUList - returns the number of CPUs in a sysfs CPU list, e.g., "0-3,8,10-11" is 7
+func countCPUList(cpuList string) (count int, err error) {
+	for _, token := range strings.Split(cpuList, ",") {
+		first, last, isRange := strings.Cut(token, "-")
+		if !isRange {
+			last = first
+		}
+		var firstCPU, lastCPU int
+		if firstCPU, err = strconv.Atoi(first); err != nil {
+			err = fmt.Errorf("failed to parse cpu list %s: %v", cpuList, err)
+			return
+		}
+		if lastCPU, err = strconv.Atoi(last); err != nil {
+			err = fmt.Errorf("failed to parse cpu list %s: %v", cpuList, err)
+			return
+		}
+		count += lastCPU - firstCPU + 1
+	}
+	return
+}
+
+// getCPUTopologyFromCPUInfo - derives the topology from the first and last /proc/cpuinfo entries
+func getCPUTopologyFromCPUInfo(cpuInfo []map[string]string) (coresPerSocket int, socketCount int, threadsPerCore int, err error) {
+	// Core Count (per socket)
+	coresPerSocket, err = strconv.Atoi(cpuInfo[0]["cpu cores"])
+	if err != nil || coresPerSocket == 0 {
+		err = fmt.Errorf("failed to retrieve cores per socket: %v", err)
+		return
+	}
+	// Socket Count
+	var maxPhysicalID int
+	if maxPhysicalID, err = strconv.Atoi(cpuInfo[len(cpuInfo)-1]["physical id"]); err != nil {
+		err = fmt.Errorf("failed to retrieve max physical id: %v", err)
+		return
+	}
+	socketCount = maxPhysicalID + 1
+	// Hyperthreading - threads per core
+	if cpuInfo[0]["siblings"] != cpuInfo[0]["cpu cores"] {
+		threadsPerCore = 2
+	} else {
+		threadsPerCore = 1
 	}
 	return
 }
 
 // getPerfSupportedEvents - returns a string containing the output from
-// 'perf list'
+// 'perf list', without the event descriptions since only the event names are searched
 func getPerfSupportedEvents(myTarget target.Target, perfPath string) (supportedEvents string, err error) {
-	cmd := exec.Command(perfPath, "list")
+	cmd := exec.Command(perfPath, "list", "--no-desc")
 	stdout, stderr, exitcode, err := myTarget.RunCommand(cmd, 0, true)
 	if err != nil {
 		err = fmt.Errorf("failed to get perf list: %s, %d, %v", stderr, exitcode, err)
@@ -413,18 +529,7 @@ func getPerfSupportedEvents(myTarget target.Target, perfPath string) (supportedE
 
 // getSupportsEvent() - checks if the event is supported by perf
 func getSupportsEvent(myTarget target.Target, event string, noRoot bool, perfPath string, localTempDir string) (supported bool, output string, err error) {
-	scriptDef := script.ScriptDefinition{
-		Name:      "perf stat " + event,
-		Script:    perfPath + " stat -a -e " + event + " sleep 1",
-		Superuser: !noRoot,
-	}
-	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
-	if err != nil {
-		err = fmt.Errorf("failed to determine if %s is supported: %s, %d, %v", event, scriptOutput.Stderr, scriptOutput.Exitcode, err)
-		return
-	}
-	supported = !strings.Contains(scriptOutput.Stderr, "<not supported>")
-	return
+	return getSupportsPerfStatEvent(myTarget, event, event, noRoot, perfPath, localTempDir)
 }
 
 // getSupportsPEBS() - checks if the PEBS events are supported on the target
@@ -432,31 +537,27 @@ func getSupportsEvent(myTarget target.Target, event string, noRoot bool, perfPat
 // Events that use MSR 0x3F7 are PEBS events. We use the INT_MISC.UNKNOWN_BRANCH_CYCLES event since
 // it is a PEBS event that we used in EMR metrics.
 func getSupportsPEBS(myTarget target.Target, noRoot bool, perfPath string, localTempDir string) (supported bool, output string, err error) {
-	scriptDef := script.ScriptDefinition{
-		Name:      "perf stat pebs",
-		Script:    perfPath + " stat -a -e cpu/event=0xad,umask=0x40,period=1000003,name='INT_MISC.UNKNOWN_BRANCH_CYCLES'/ sleep 1",
-		Superuser: !noRoot,
-	}
-	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
-	if err != nil {
-		err = fmt.Errorf("failed to determine if pebs is supported: %s, %d, %v", scriptOutput.Stderr, scriptOutput.Exitcode, err)
-		return
-	}
-	supported = !strings.Contains(scriptOutput.Stderr, "<not supported>")
-	return
+	return getSupportsPerfStatEvent(myTarget, "pebs", "cpu/event=0xad,umask=0x40,period=1000003,name='INT_MISC.UNKNOWN_BRANCH_CYCLES'/", noRoot, perfPath, localTempDir)
 }
 
 // getSupportsOCR() - checks if the offcore response events are supported on the target
 // On some VMs, e.g. GCP C4, offcore response events are not supported and perf returns '<not supported>'
 func getSupportsOCR(myTarget target.Target, noRoot bool, perfPath string, localTempDir string) (supported bool, output string, err error) {
+	return getSupportsPerfStatEvent(myTarget, "ocr", "cpu/event=0x2a,umask=0x01,offcore_rsp=0x104004477,name='OCR.READS_TO_CORE.LOCAL_DRAM'/", noRoot, perfPath, localTempDir)
+}
+
+// getSupportsPerfStatEvent() - runs perf stat on the given event and checks that perf
+// does not report it as '<not supported>'. The label is used to name the script and in
+// error messages.
+func getSupportsPerfStatEvent(myTarget target.Target, label string, event string, noRoot bool, perfPath string, localTempDir string) (supported bool, output string, err error) {
 	scriptDef := script.ScriptDefinition{
-		Name:      "perf stat ocr",
-		Script:    perfPath + " stat -a -e cpu/event=0x2a,umask=0x01,offcore_rsp=0x104004477,name='OCR.READS_TO_CORE.LOCAL_DRAM'/ sleep 1",
+		Name:      "perf stat " + label,
+		Script:    perfPath + " stat -a -e " + event + " sleep 1",
 		Superuser: !noRoot,
 	}
 	scriptOutput, err := script.RunScript(myTarget, scriptDef, localTempDir)
 	if err != nil {
-		err = fmt.Errorf("failed to determine if ocr is supported: %s, %d, %v", scriptOutput.Stderr, scriptOutput.Exitcode, err)
+		err = fmt.Errorf("failed to determine if %s is supported: %s, %d, %v", label, scriptOutput.Stderr, scriptOutput.Exitcode, err)
 		return
 	}
 	supported = !strings.Contains(scriptOutput.Stderr, "<not supported>")
@@ -573,7 +674,7 @@ func getSupportsFixedEvent(myTarget target.Target, event string, uarch string, n
 func getPMUDriverVersion(myTarget target.Target, localTempDir string) (version string, err error) {
 	scriptDef := script.ScriptDefinition{
 		Name:      "pmu driver version",
-		Script:    "dmesg | grep -A 1 \"Intel PMU driver\" | tail -1 | awk '{print $NF}'",
+		Script:    "dmesg | awk '/Intel PMU driver/ {getline; version=$NF} END {print version}'",
 		Superuser: true,
 	}
 	output, err := script.RunScript(myTarget, scriptDef, localTempDir)
@@ -598,10 +699,15 @@ func getTSCFreqHz(myTarget target.Target, localTempDir string) (freqHz int, err
 	if err != nil {
 		return
 	}
-	freqMhz, err := strconv.Atoi(output.Stdout)
+	freqMhz, err := strconv.Atoi(strings.TrimSpace(output.Stdout))
 	if err != nil {
 		return
 	}
+	// a zero frequency means calibration failed
+	if freqMhz <= 0 {
+		err = fmt.Errorf("invalid TSC frequency: %d MHz", freqMhz)
+		return
+	}
 	// convert MHz to Hz
 	freqHz = freqMhz * 1000000
 	return
@@ -6,6 +6,8 @@ package metrics
 // metric generation type defintions and helper functions
 
 import (
+	"bufio"
+	"context"
 	"fmt"
 	"log/slog"
 	"math"
@@ -42,6 +44,17 @@ func ProcessEvents(perfEvents [][]byte, eventGroupDefinitions []GroupDefinition,
 		err = fmt.Errorf("failed to put perf events into groups: %v", err)
 		return
 	}
+	// the processes are the same for every frame
+	var pidList []string
+	var cmdList []string
+	for _, process := range processes {
+		pidList = append(pidList, process.pid)
+		cmdList = append(cmdList, process.cmd)
+	}
+	pids := strings.Join(pidList, ",")
+	cmds := strings.Join(cmdList, ",")
+	// only format the variables when they will be logged
+	debugEnabled := slog.Default().Enabled(context.Background(), slog.LevelDebug)
 	metricFrames = make([]MetricFrame, 0, len(eventFrames))
 	for _, eventFrame := range eventFrames {
 		timeStamp = eventFrame.Timestamp
@@ -51,14 +64,8 @@ func ProcessEvents(perfEvents [][]byte, eventGroupDefinitions []GroupDefinition,
 		metricFrame.Socket = eventFrame.Socket
 		metricFrame.CPU = eventFrame.CPU
 		metricFrame.Cgroup = eventFrame.Cgroup
-		var pidList []string
-		var cmdList []string
-		for _, process := range processes {
-			pidList = append(pidList, process.pid)
-			cmdList = append(cmdList, process.cmd)
-		}
-		metricFrame.PID = strings.Join(pidList, ",")
-		metricFrame.Cmd = strings.Join(cmdList, ",")
+		metricFrame.PID = pids
+		metricFrame.Cmd = cmds
 		// produce metrics from event groups
 		for _, metricDef := range metricDefinitions {
 			metric := Metric{Name: metricDef.Name, Value: math.NaN()}
@@ -76,6 +83,9 @@ func ProcessEvents(perfEvents [][]byte, eventGroupDefinitions []GroupDefinition,
 				}
 			}
 			metricFrame.Metrics = append(metricFrame.Metrics, metric)
+			if !debugEnabled {
+				continue
+			}
 			var prettyVars []string
 			for variableName := range variables {
 				prettyVars = append(prettyVars, fmt.Sprintf("%s=%f", variableName, variables[variableName]))
@@ -235,6 +245,20 @@ func evaluateExpression(metric MetricDefinition, variables map[string]interface{
 	return
 }
 
+// write string content to file
+func writeStringToFile(path string, content string) (err error) {
+	var file *os.File
+	if file, err = os.OpenFile(path, os.O_CREATE|os.O_TRUNC|os.O_WRONLY, 0644); err != nil {
+		return
+	}
+	if _, err = file.WriteString(content); err != nil {
+		file.Close()
+		return
+	}
+	err = file.Close()
+	return
+}
+
 // write json formatted events to raw file
 func writeEventsToFile(path string, events [][]byte) (err error) {
 	var rawFile *os.File
@@ -243,12 +267,21 @@ func writeEventsToFile(path string, events [][]byte) (err error) {
 		return
 	}
 	defer rawFile.Close()
+	// one event per line
+	writer := bufio.NewWriter(rawFile)
 	for _, rawEvent := range events {
-		rawEvent = append(rawEvent, []byte("\n")...)
-		if _, err = rawFile.Write(rawEvent); err != nil {
+		if _, err = writer.Write(rawEvent); err != nil {
 			slog.Error("failed to write event to raw file", slog.String("error", err.Error()))
 			return
 		}
+		if err = writer.WriteByte('\n'); err != nil {
+			slog.Error("failed to write event to raw file", slog.String("error", err.Error()))
+			return
+		}
+	}
+	if err = writer.Flush(); err != nil {
+		slog.Error("failed to write event to raw file", slog.String("error", err.Error()))
+		return
 	}
 	return
 }
@@ -741,47 +741,63 @@ func runCmd(cmd *cobra.Command, args []string) error {
 	// summarize outputs
 	if !flagLive {
 		multiSpinner.Finish()
-		for i, ctx := range targetContexts {
+		// csv summary, and html summary when the data has a single set of metrics
+		htmlSummary := (flagScope == scopeSystem || flagScope == scopeProcess) && flagGranularity == granularitySystem
+		// each target's metrics file is independent, so summarize them concurrently
+		type summaryOutput struct {
+			csvOut  string
+			htmlOut string
+			err     error
+		}
+		summaries := make([]summaryOutput, len(targetContexts))
+		var summaryWaitGroup sync.WaitGroup
+		for i := range targetContexts {
 			if targetContexts[i].err != nil {
 				continue
 			}
-			myTarget := targetContexts[i].target
-			// csv summary
-			out, err := Summarize(localOutputDir+"/"+myTarget.GetName()+"_"+"metrics.csv", false, ctx.metadata)
-			if err != nil {
-				err = fmt.Errorf("failed to summarize output: %w", err)
-				fmt.Fprintf(os.Stderr, "Error: %v\n", err)
-				slog.Error(err.Error())
-				cmd.SilenceUsage = true
-				return err
+			summaryWaitGroup.Add(1)
+			go func(i int) {
+				defer summaryWaitGroup.Done()
+				summary := &summaries[i]
+				summary.csvOut, summary.htmlOut, summary.err = Summarize(localOutputDir+"/"+targetContexts[i].target.GetName()+"_"+"metrics.csv", htmlSummary, targetContexts[i].metadata)
+			}(i)
+		}
+		summaryWaitGroup.Wait()
+		for i := range targetContexts {
+			if targetContexts[i].err != nil {
+				continue
 			}
-			if err = os.WriteFile(localOutputDir+"/"+myTarget.GetName()+"_"+"metrics_summary.csv", []byte(out), 0644); err != nil {
-				err = fmt.Errorf("failed to write summary to file: %w", err)
+			// output files share the target's prefix
+			outputFilePrefix := localOutputDir + "/" + targetContexts[i].target.GetName() + "_"
+			csvOut, htmlOut, summaryErr := summaries[i].csvOut, summaries[i].htmlOut, summaries[i].err
+			// write the csv summary even if the html summary failed
+			if csvOut != "" {
+				if err := writeStringToFile(outputFilePrefix+"metrics_summary.csv", csvOut); err != nil {
+					err = fmt.Errorf("failed to write summary to file: %w", err)
+					fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+					slog.Error(err.Error())
+					cmd.SilenceUsage = true
+					return err
+				}
+				targetContexts[i].printedFiles = append(targetContexts[i].printedFiles, outputFilePrefix+"metrics_summary.csv")
+			}
+			if summaryErr != nil {
+				err := fmt.Errorf("failed to summarize output: %w", summaryErr)
 				fmt.Fprintf(os.Stderr, "Error: %v\n", err)
 				slog.Error(err.Error())
 				cmd.SilenceUsage = true
 				return err
 			}
-			targetContexts[i].printedFiles = append(targetContexts[i].printedFiles, localOutputDir+"/"+myTarget.GetName()+"_"+"metrics_summary.csv")
 			// html summary
-			htmlSummary := (flagScope == scopeSystem || flagScope == scopeProcess) && flagGranularity == granularitySystem
-			if htmlSummary {
-				out, err = Summarize(localOutputDir+"/"+myTarget.GetName()+"_"+"metrics.csv", true, ctx.metadata)
-				if err != nil {
-					err = fmt.Errorf("failed to summarize output as HTML: %w", err)
-					fmt.Fprintf(os.Stderr, "Error: %v\n", err)
-					slog.Error(err.Error())
-					cmd.SilenceUsage = true
-					return err
-				}
-				if err = os.WriteFile(localOutputDir+"/"+myTarget.GetName()+"_"+"metrics_summary.html", []byte(out), 0644); err != nil {
+			if htmlOut != "" {
+				if err := writeStringToFile(outputFilePrefix+"metrics_summary.html", htmlOut); err != nil {
 					err = fmt.Errorf("failed to write HTML summary to file: %w", err)
 					fmt.Fprintf(os.Stderr, "Error: %v\n", err)
 					slog.Error(err.Error())
 					cmd.SilenceUsage = true
 					return err
 				}
-				targetContexts[i].printedFiles = append(targetContexts[i].printedFiles, localOutputDir+"/"+myTarget.GetName()+"_"+"metrics_summary.html")
+				targetContexts[i].printedFiles = append(targetContexts[i].printedFiles, outputFilePrefix+"metrics_summary.html")
 			}
 		}
 		// print the names of the files that were created
@@ -858,7 +874,13 @@ func prepareTarget(targetContext *targetContext, targetTempRoot string, localTem
 			channelError <- targetError{target: myTarget, err: err}
 			return
 		}
-		if err = SetAllMuxIntervals(myTarget, flagPerfMuxInterval, localTempDir); err != nil {
+		// devices already at the desired interval need neither setting nor restoring
+		for device, interval := range targetContext.perfMuxIntervals {
+			if interval == flagPerfMuxInterval {
+				delete(targetContext.perfMuxIntervals, device)
+			}
+		}
+		if err = SetAllMuxIntervals(myTarget, targetContext.perfMuxIntervals, flagPerfMuxInterval, localTempDir); err != nil {
 			err = fmt.Errorf("failed to set all perf mux intervals: %w", err)
 			_ = statusUpdate(myTarget.GetName(), fmt.Sprintf("Error: %s", err.Error()))
 			targetContext.err = err
@@ -1089,15 +1111,23 @@ func getPerfCommandArgs(pids string, cgroups []string, timeout int, eventGroups
 	}
 	// -e: event groups to collect
 	args = append(args, "-e")
-	var groups []string
-	for _, group := range eventGroups {
-		var events []string
-		for _, event := range group {
-			events = append(events, event.Raw)
+	var eventsArg strings.Builder
+	eventsArg.WriteByte('\'')
+	for i, group := range eventGroups {
+		if i > 0 {
+			eventsArg.WriteByte(',')
+		}
+		eventsArg.WriteByte('{')
+		for j, event := range group {
+			if j > 0 {
+				eventsArg.WriteByte(',')
+			}
+			eventsArg.WriteString(event.Raw)
 		}
-		groups = append(groups, fmt.Sprintf("{%s}", strings.Join(events, ",")))
+		eventsArg.WriteByte('}')
 	}
-	args = append(args, fmt.Sprintf("'%s'", strings.Join(groups, ",")))
+	eventsArg.WriteByte('\'')
+	args = append(args, eventsArg.String())
 	if len(argsApplication) > 0 {
 		// add application args
 		args = append(args, "--")
@@ -1228,6 +1258,7 @@ func runPerf(myTarget target.Target, noRoot bool, processes []Process, cmd *exec
 	t1 := time.NewTimer(time.Duration(2 * flagPerfPrintInterval * 1000))
 	var frameTimestamp float64
 	frameCount := 0
+	eventsFilePath := outputDir + "/" + myTarget.GetName() + "_" + "events.json"
 	stopAnonymousFuncChannel := make(chan bool)
 	go func() {
 		for {
@@ -1238,7 +1269,7 @@ func runPerf(myTarget target.Target, noRoot bool, processes []Process, cmd *exec
 			}
 			if len(outputLines) != 0 {
 				if flagWriteEventsToFile {
-					if err = writeEventsToFile(outputDir+"/"+myTarget.GetName()+"_"+"events.json", outputLines); err != nil {
+					if err = writeEventsToFile(eventsFilePath, outputLines); err != nil {
 						err = fmt.Errorf("failed to write events to raw file: %v", err)
 						slog.Error(err.Error())
 						return
@@ -1290,7 +1321,7 @@ func runPerf(myTarget target.Target, noRoot bool, processes []Process, cmd *exec
 	// process any remaining events
 	if len(outputLines) != 0 {
 		if flagWriteEventsToFile {
-			if err = writeEventsToFile(outputDir+"/"+myTarget.GetName()+"_"+"events.json", outputLines); err != nil {
+			if err = writeEventsToFile(eventsFilePath, outputLines); err != nil {
 				err = fmt.Errorf("failed to write events to raw file: %v", err)
 				slog.Error(err.Error())
 				return
@@ -39,34 +39,26 @@ func NMIWatchdogEnabled(myTarget target.Target) (enabled bool, err error) {
 	return
 }
 
+// nmiWatchdogPath - procfs file backing the kernel.nmi_watchdog sysctl
+const nmiWatchdogPath = "/proc/sys/kernel/nmi_watchdog"
+
 // getNMIWatchdog - gets the kernel.nmi_watchdog configuration value (0 or 1)
 func getNMIWatchdog(myTarget target.Target) (setting string, err error) {
-	// sysctl kernel.nmi_watchdog
-	// kernel.nmi_watchdog = [0|1]
-	var sysctl string
-	if sysctl, err = findSysctl(myTarget); err != nil {
-		return
-	}
-	cmd := exec.Command(sysctl, "kernel.nmi_watchdog")
-	stdout, _, _, err := myTarget.RunCommand(cmd, 0, true)
+	cmd := exec.Command("cat", nmiWatchdogPath)
+	stdout, stderr, exitcode, err := myTarget.RunCommand(cmd, 0, true)
 	if err != nil {
+		err = fmt.Errorf("failed to read %s: %s, %d, %v", nmiWatchdogPath, stderr, exitcode, err)
 		return
 	}
-	out := stdout
-	setting = out[len(out)-2 : len(out)-1]
+	setting = strings.TrimSpace(stdout)
 	return
 }
 
 // setNMIWatchdog -sets the kernel.nmi_watchdog configuration value
 func setNMIWatchdog(myTarget target.Target, setting string, localTempDir string) (err error) {
-	// sysctl kernel.nmi_watchdog=[0|1]
-	var sysctl string
-	if sysctl, err = findSysctl(myTarget); err != nil {
-		return
-	}
 	_, err = script.RunScript(myTarget, script.ScriptDefinition{
 		Name:      "set NMI watchdog",
-		Script:    fmt.Sprintf("%s kernel.nmi_watchdog=%s", sysctl, setting),
+		Script:    fmt.Sprintf("echo %s > %s", setting, nmiWatchdogPath),
 		Superuser: true},
 		localTempDir)
 	if err != nil {
@@ -82,25 +74,3 @@ func setNMIWatchdog(myTarget target.Target, setting string, localTempDir string)
 	}
 	return
 }
-
-// findSysctl - gets a useable path to sysctl or error
-func findSysctl(myTarget target.Target) (path string, err error) {
-	cmd := exec.Command("which", "sysctl")
-	stdout, _, _, err := myTarget.RunCommand(cmd, 0, true)
-	if err == nil {
-		//found it
-		path = strings.TrimSpace(stdout)
-		return
-	}
-	// didn't find it on the path, try being specific
-	sbinPath := "/usr/sbin/sysctl"
-	cmd = exec.Command("which", sbinPath)
-	_, _, _, err = myTarget.RunCommand(cmd, 0, true)
-	if err == nil {
-		// found it
-		path = sbinPath
-		return
-	}
-	err = fmt.Errorf("sysctl not found on path or at %s", sbinPath)
-	return
-}
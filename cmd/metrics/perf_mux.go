@@ -16,18 +16,21 @@ import (
 
 // GetMuxIntervals - get a map of sysfs device file names to current mux value for the associated device
 func GetMuxIntervals(myTarget target.Target, localTempDir string) (intervals map[string]int, err error) {
-	bash := "for file in $(find /sys/devices -type f -name perf_event_mux_interval_ms); do echo $file $(cat $file); done"
+	// one grep reads all of the files, output is file:value
+	// unreadable or vanished paths under /sys/devices make find exit non-zero, rely on the parsed output instead
+	bash := "find /sys/devices -type f -name perf_event_mux_interval_ms -exec grep -H . {} + 2>/dev/null || true"
 	scriptOutput, err := script.RunScript(myTarget, script.ScriptDefinition{Name: "get mux intervals", Script: bash, Superuser: false}, localTempDir)
 	if err != nil {
 		return
 	}
 	intervals = make(map[string]int)
 	for _, line := range strings.Split(scriptOutput.Stdout, "\n") {
-		fields := strings.Fields(line)
-		if len(fields) == 2 {
-			if interval, err := strconv.Atoi(fields[1]); err == nil {
-				intervals[fields[0]] = interval
-			}
+		separatorIdx := strings.LastIndex(line, ":")
+		if separatorIdx == -1 {
+			continue
+		}
+		if interval, err := strconv.Atoi(strings.TrimSpace(line[separatorIdx+1:])); err == nil {
+			intervals[line[:separatorIdx]] = interval
 		}
 	}
 	return
@@ -35,11 +38,23 @@ func GetMuxIntervals(myTarget target.Target, localTempDir string) (intervals map
 
 // SetMuxIntervals - write the given intervals (values in ms) to the given sysfs device file names (key)
 func SetMuxIntervals(myTarget target.Target, intervals map[string]int, localTempDir string) (err error) {
-	var bash string
-	for device := range intervals {
-		bash += fmt.Sprintf("echo %d > %s; ", intervals[device], device)
+	// group the device files by interval so that each distinct value is written by one loop
+	devicesByInterval := make(map[int][]string)
+	for device, interval := range intervals {
+		// the kernel rejects a zero interval
+		if interval <= 0 {
+			continue
+		}
+		devicesByInterval[interval] = append(devicesByInterval[interval], device)
+	}
+	if len(devicesByInterval) == 0 {
+		return
 	}
-	scriptOutput, err := script.RunScript(myTarget, script.ScriptDefinition{Name: "set mux intervals", Script: bash, Superuser: true}, localTempDir)
+	var bash strings.Builder
+	for interval, devices := range devicesByInterval {
+		fmt.Fprintf(&bash, "for file in %s; do echo %d > $file; done; ", strings.Join(devices, " "), interval)
+	}
+	scriptOutput, err := script.RunScript(myTarget, script.ScriptDefinition{Name: "set mux intervals", Script: bash.String(), Superuser: true}, localTempDir)
 	if err != nil {
 		err = fmt.Errorf("failed to set mux interval on device: %s, %d, %v", scriptOutput.Stderr, scriptOutput.Exitcode, err)
 		return
@@ -47,12 +62,12 @@ func SetMuxIntervals(myTarget target.Target, intervals map[string]int, localTemp
 	return
 }
 
-// SetAllMuxIntervals - writes the given interval (ms) to all perf mux sysfs device files
-func SetAllMuxIntervals(myTarget target.Target, interval int, localTempDir string) (err error) {
-	bash := fmt.Sprintf("for file in $(find /sys/devices -type f -name perf_event_mux_interval_ms); do echo %d > $file; done", interval)
-	_, err = script.RunScript(myTarget, script.ScriptDefinition{Name: "set all mux intervals", Script: bash, Superuser: true}, localTempDir)
-	if err != nil {
-		return
+// SetAllMuxIntervals - writes the given interval (ms) to all perf mux sysfs device files found
+// by GetMuxIntervals, i.e., the keys of currentIntervals
+func SetAllMuxIntervals(myTarget target.Target, currentIntervals map[string]int, interval int, localTempDir string) (err error) {
+	intervals := make(map[string]int, len(currentIntervals))
+	for device := range currentIntervals {
+		intervals[device] = interval
 	}
-	return
+	return SetMuxIntervals(myTarget, intervals, localTempDir)
 }
@@ -44,7 +44,7 @@ func printMetricsJSON(metricFrames []MetricFrame, targetName string, printToStdo
 				return
 			}
 			defer file.Close()
-			_, err = file.WriteString(string(jsonBytes) + "\n")
+			_, err = file.Write(append(jsonBytes, '\n'))
 			if err != nil {
 				return
 			}
@@ -68,6 +68,8 @@ func printMetricsCSV(metricFrames []MetricFrame, targetName string, printToStdou
 		}
 		defer file.Close()
 	}
+	// the collection start time is the same for every frame
+	startEpoch := gCollectionStartTime.Unix()
 	for _, metricFrame := range metricFrames {
 		if metricFrame.FrameCount == 1 {
 			contextHeaders := "TS,SKT,CPU,CID,"
@@ -95,7 +97,7 @@ func printMetricsCSV(metricFrames []MetricFrame, targetName string, printToStdou
 				}
 			}
 		}
-		metricContext := fmt.Sprintf("%d,%s,%s,%s,", gCollectionStartTime.Unix()+int64(metricFrame.Timestamp), metricFrame.Socket, metricFrame.CPU, metricFrame.Cgroup)
+		metricContext := fmt.Sprintf("%d,%s,%s,%s,", startEpoch+int64(metricFrame.Timestamp), metricFrame.Socket, metricFrame.CPU, metricFrame.Cgroup)
 		values := make([]string, 0, len(metricFrame.Metrics))
 		for _, metric := range metricFrame.Metrics {
 			values = append(values, strconv.FormatFloat(metric.Value, 'g', 8, 64))
@@ -129,6 +131,7 @@ func printMetricsWide(metricFrames []MetricFrame, targetName string, printToStdo
 		}
 		defer file.Close()
 	}
+	startEpoch := gCollectionStartTime.Unix()
 	for _, metricFrame := range metricFrames {
 		var names []string
 		var values []float64
@@ -170,7 +173,7 @@ func printMetricsWide(metricFrames []MetricFrame, targetName string, printToStdo
 		}
 		// handle values
 		TimestampColWidth := 10
-		formattedTimestamp := fmt.Sprintf("%d", gCollectionStartTime.Unix()+int64(metricFrame.Timestamp))
+		formattedTimestamp := fmt.Sprintf("%d", startEpoch+int64(metricFrame.Timestamp))
 		row := fmt.Sprintf("%s%*s%*s", formattedTimestamp, TimestampColWidth-len(formattedTimestamp), "", colSpacing, "")
 		if metricFrame.PID != "" {
 			PIDColWidth := 7
@@ -26,7 +26,7 @@ type Process struct {
 }
 
 // pid,ppid,comm,cmd
-var psRegex = `^\s*(\d+)\s+(\d+)\s+([\w\d\(\)\:\/_\-\:\.]+)\s+(.*)`
+var psRegex = regexp.MustCompile(`^\s*(\d+)\s+(\d+)\s+([\w\d\(\)\:\/_\-\:\.]+)\s+(.*)`)
 
 // GetProcesses - gets the list of processes associated with the given list of
 // process IDs. An error occurs when a given PID is not found in the current
@@ -48,10 +48,28 @@ func GetProcesses(myTarget target.Target, pids []string) (processes []Process, e
 // partial cgroup names. An error occurs when a given cgroup name is not found in the
 // current set of process cgroups.
 func GetCgroups(myTarget target.Target, cids []string, localTempDir string) (cgroups []string, err error) {
+	if len(cids) == 0 {
+		return
+	}
+	// one regex matches any of the container IDs
+	quotedCids := make([]string, 0, len(cids))
+	for _, cid := range cids {
+		quotedCids = append(quotedCids, regexp.QuoteMeta(cid))
+	}
+	output, err := script.RunScript(myTarget, getCgroupsScript(strings.Join(quotedCids, "|")), localTempDir)
+	if err != nil {
+		err = fmt.Errorf("failed to get cgroups: %v", err)
+		return
+	}
+	paths := strings.Split(strings.TrimSpace(output.Stdout), "\n")
 	for _, cid := range cids {
+		// the first match in traversal order, empty if not found
 		var cgroup string
-		if cgroup, err = getCgroup(myTarget, cid, localTempDir); err != nil {
-			return
+		for _, path := range paths {
+			if strings.Contains(path, cid) {
+				cgroup = path
+				break
+			}
 		}
 		cgroups = append(cgroups, cgroup)
 	}
@@ -75,12 +93,11 @@ func GetHotProcesses(myTarget target.Target, maxProcesses int, filter string) (p
 			return
 		}
 	}
-	reProcess := regexp.MustCompile(psRegex)
 	for _, line := range strings.Split(psOutput, "\n") {
 		if line == "" {
 			continue
 		}
-		match := reProcess.FindStringSubmatch(line)
+		match := psRegex.FindStringSubmatch(line)
 		if match == nil {
 			slog.Warn("Unrecognized ps output format", slog.String("line", line))
 			continue
@@ -126,8 +143,8 @@ func GetHotCgroups(myTarget target.Target, maxCgroups int, filter string, localT
 # Directory to search for cgroups
 search_dir="/sys/fs/cgroup"
 
-# Find matching cgroups
-matching_cgroups=$(find "$search_dir" -type d \( -name "docker*scope" -o -name "containerd*scope" \))
+# Find matching cgroups, don't descend into matching scopes since they don't contain other container scopes
+matching_cgroups=$(find "$search_dir" -type d \( -name "docker*scope" -o -name "containerd*scope" \) -print -prune)
 
 # Filter matching cgroups based on regex if provided
 regex=%s
@@ -135,22 +152,22 @@ if [ -n "$regex" ]; then
     matching_cgroups=$(echo "$matching_cgroups" | grep -E "$regex")
 fi
 
-# Get CPU usage for each matching cgroup
-declare -A cgroup_cpu_usage
-for cgroup in $matching_cgroups; do
-    if [ -f "$cgroup/cpu.stat" ]; then
-        cpu_usage=$(grep 'usage_usec' "$cgroup/cpu.stat" | awk '{print $2}')
-        if [ -n "$cpu_usage" ]; then
-            cgroup_path=${cgroup#"$search_dir"}
-            cgroup_cpu_usage["$cgroup_path"]=$cpu_usage
-        fi
-    fi
-done
-
-# Sort cgroups by CPU usage and get the top N
-for cgroup in "${!cgroup_cpu_usage[@]}"; do
-    echo "${cgroup_cpu_usage[$cgroup]} $cgroup"
-done | sort -nr | head -n %d
+# Get CPU usage for each matching cgroup, then sort cgroups by CPU usage and get the top N.
+# getline returns -1 for missing or unreadable cpu.stat files, e.g., cgroup v1 or exited
+# containers, so they are skipped.
+printf '%%s\n' $matching_cgroups |
+    awk -v dir="$search_dir" '{
+        file = $0 "/cpu.stat"
+        while ((getline line < file) > 0) {
+            if (line ~ /^usage_usec /) {
+                split(line, fields, " ")
+                print fields[2], substr($0, length(dir) + 1)
+                break
+            }
+        }
+        close(file)
+    }' |
+    sort -nr | head -n %d
 `, filter, maxCgroups),
 		Superuser: true,
 	}
@@ -165,6 +182,10 @@ done | sort -nr | head -n %d
 			continue
 		}
 		fields := strings.Fields(line)
+		if len(fields) < 2 {
+			slog.Warn("Unrecognized hot cgroups output format", slog.String("line", line))
+			continue
+		}
 		cgroups = append(cgroups, fields[1])
 	}
 	slog.Debug("Hot CIDs", slog.String("CIDs", strings.Join(cgroups, ", ")))
@@ -190,8 +211,7 @@ func getProcess(myTarget target.Target, pid string) (process Process, err error)
 		return
 	}
 	psOutput := stdout
-	reProcess := regexp.MustCompile(psRegex)
-	match := reProcess.FindStringSubmatch(psOutput)
+	match := psRegex.FindStringSubmatch(psOutput)
 	if match == nil {
 		err = fmt.Errorf("Process not found, PID: %s, ps output: %s", pid, psOutput)
 		return
@@ -200,26 +220,17 @@ func getProcess(myTarget target.Target, pid string) (process Process, err error)
 	return
 }
 
-func getCgroup(myTarget target.Target, cid string, localTempDir string) (cGroupName string, err error) {
-	cgroupScript := script.ScriptDefinition{
-		Name: "cgroup",
+func getCgroupsScript(cidRegex string) script.ScriptDefinition {
+	return script.ScriptDefinition{
+		Name: "cgroups",
 		Script: fmt.Sprintf(`
 # Directory to search for cgroups
 search_dir="/sys/fs/cgroup"
 
-# Find the full cgroup path that matches the partial container ID
-full_path=$(find "$search_dir" -type d | grep %s)
-
-cgroup_path=${full_path#"$search_dir"}
-echo $cgroup_path
-`, cid),
+# Find the full cgroup paths that match any of the partial container IDs
+# print paths relative to the search directory, e.g., /system.slice/docker-<id>.scope
+find "$search_dir" -mindepth 1 -type d -regextype posix-extended -regex '.*(%s).*' -printf '/%%P\n'
+`, cidRegex),
 		Superuser: true,
 	}
-	output, err := script.RunScript(myTarget, cgroupScript, localTempDir)
-	if err != nil {
-		err = fmt.Errorf("failed to get cgroup: %v", err)
-		return
-	}
-	cGroupName = strings.TrimSpace(output.Stdout)
-	return
 }
@@ -10,35 +10,44 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"log/slog"
 	"math"
 	"os"
 	"strconv"
 	"strings"
-
-	"perfspect/internal/util"
 )
 
 // Summarize - generates formatted output from a CSV file containing metric values.
-// The output can be in CSV or HTML format. Set html to true to generate HTML output otherwise CSV is generated.
-func Summarize(csvInputPath string, html bool, metadata Metadata) (out string, err error) {
+// The CSV summary is always generated. Set includeHTML to true to also generate the HTML summary
+// from the same parsed data.
+// The CSV summary is returned even when the HTML summary fails, the HTML summary is empty when
+// the data holds more than one set of metrics.
+func Summarize(csvInputPath string, includeHTML bool, metadata Metadata) (csvOut string, htmlOut string, err error) {
 	var metrics []metricsFromCSV
 	if metrics, err = newMetricsFromCSV(csvInputPath); err != nil {
 		return
 	}
-	if html {
-		if len(metrics) > 1 {
-			err = fmt.Errorf("html format is supported only when data's scope is '%s' or '%s' and granularity is '%s'", scopeSystem, scopeProcess, granularitySystem)
+	// one set of metrics per socket, CPU, process, or cgroup
+	var sb strings.Builder
+	var firstStats map[string]metricStats
+	for i, m := range metrics {
+		var stats map[string]metricStats
+		if stats, err = m.getStats(); err != nil {
 			return
 		}
-		out, err = metrics[0].getHTML(metadata)
-	} else {
-		for i, m := range metrics {
-			var oneOut string
-			if oneOut, err = m.getCSV(i == 0); err != nil {
-				return
-			}
-			out += oneOut
+		if i == 0 {
+			firstStats = stats
 		}
+		sb.WriteString(m.getCSV(stats, i == 0))
+	}
+	csvOut = sb.String()
+	// the CSV summary is returned even when the HTML summary can't be produced
+	if includeHTML {
+		if len(metrics) != 1 {
+			slog.Warn("skipping HTML summary", slog.String("reason", fmt.Sprintf("html format is supported only when data's scope is '%s' or '%s' and granularity is '%s'", scopeSystem, scopeProcess, granularitySystem)))
+			return
+		}
+		htmlOut, err = metrics[0].getHTML(firstStats, metadata)
 	}
 	return
 }
@@ -60,7 +69,7 @@ type row struct {
 
 // newRow loads a row structure with given fields and field names
 func newRow(fields []string, names []string) (r row, err error) {
-	r.metrics = make(map[string]float64)
+	r.metrics = make(map[string]float64, len(names))
 	for fIdx, field := range fields {
 		if fIdx == idxTimestamp {
 			var ts float64
@@ -112,9 +121,12 @@ func newMetricsFromCSV(csvPath string) (metrics []metricsFromCSV, err error) {
 	if file, err = os.Open(csvPath); err != nil {
 		return
 	}
+	defer file.Close()
 	reader := csv.NewReader(file)
+	reader.ReuseRecord = true
 	groupByField := -1
-	var groupByValues []string
+	// index into metrics for each groupBy value
+	groupByIndices := make(map[string]int)
 	var metricNames []string
 	var nonMetricNames []string
 	for idx := 0; true; idx++ {
@@ -166,11 +178,11 @@ func newMetricsFromCSV(csvPath string) (metrics []metricsFromCSV, err error) {
 			metrics[0].rows = append(metrics[0].rows, r)
 		} else {
 			groupByValue := fields[groupByField]
-			var listIdx int
-			if listIdx, err = util.StringIndexInList(groupByValue, groupByValues); err != nil {
-				groupByValues = append(groupByValues, groupByValue)
+			listIdx, ok := groupByIndices[groupByValue]
+			if !ok {
 				metrics = append(metrics, metricsFromCSV{})
 				listIdx = len(metrics) - 1
+				groupByIndices[groupByValue] = listIdx
 				metrics[listIdx].names = metricNames
 				if groupByField == idxSocket {
 					metrics[listIdx].groupByField = nonMetricNames[idxSocket]
@@ -196,17 +208,18 @@ func (m *metricsFromCSV) getStats() (stats map[string]metricStats, err error) {
 		mean := math.NaN()
 		stddev := math.NaN()
 		count := 0
-		sum := 0.0
+		// single pass over the rows, mean and variance are accumulated with Welford's method
+		runningMean := 0.0
+		distanceSquaredSum := 0.0
 		for _, row := range m.rows {
 			val := row.metrics[metricName]
 			if math.IsNaN(val) || math.IsInf(val, 0) {
 				continue
 			}
-			if math.IsNaN(min) { // min was initialized to NaN
-				// first non-NaN value, so initialize
-				min = math.MaxFloat64
-				max = 0
-				sum = 0
+			if count == 0 {
+				// first valid value, so initialize
+				min = val
+				max = val
 			}
 			if val < min {
 				min = val
@@ -214,22 +227,14 @@ func (m *metricsFromCSV) getStats() (stats map[string]metricStats, err error) {
 			if val > max {
 				max = val
 			}
-			sum += val
 			count++
+			delta := val - runningMean
+			runningMean += delta / float64(count)
+			distanceSquaredSum += delta * (val - runningMean)
 		}
 		// must be at least one valid value for this metric to calculate mean and standard deviation
 		if count > 0 {
-			mean = sum / float64(count)
-			distanceSquaredSum := 0.0
-			for _, row := range m.rows {
-				val := row.metrics[metricName]
-				if math.IsNaN(val) || math.IsInf(val, 0) {
-					continue
-				}
-				distance := mean - val
-				squared := distance * distance
-				distanceSquaredSum += squared
-			}
+			mean = runningMean
 			stddev = math.Sqrt(distanceSquaredSum / float64(count))
 		}
 		stats[metricName] = metricStats{mean: mean, min: min, max: max, stddev: stddev}
@@ -238,17 +243,13 @@ func (m *metricsFromCSV) getStats() (stats map[string]metricStats, err error) {
 }
 
 // getHTML - generate a string containing HTML representing the metrics
-func (m *metricsFromCSV) getHTML(metadata Metadata) (html string, err error) {
-	var stats map[string]metricStats
-	if stats, err = m.getStats(); err != nil {
-		return
-	}
+func (m *metricsFromCSV) getHTML(stats map[string]metricStats, metadata Metadata) (html string, err error) {
 	var htmlTemplate []byte
 	if htmlTemplate, err = resources.ReadFile("resources/base.html"); err != nil {
 		return
 	}
-	html = string(htmlTemplate)
-	html = strings.Replace(html, "TRANSACTIONS", "false", 1) // no transactions for now
+	// placeholder and value pairs, the template is filled in one pass at the end
+	replacements := []string{"TRANSACTIONS", "false"} // no transactions for now
 
 	// hack to determine the architecture of the metrics source
 	var archIndex int
@@ -294,11 +295,11 @@ func (m *metricsFromCSV) getHTML(metadata Metadata) (html string, err error) {
 					metricVal = stats[tmpl.metricNames[archIndex]].mean
 				}
 			}
-			html = strings.Replace(html, tmpl.tmplVar, fmt.Sprintf("%f", metricVal), -1)
+			replacements = append(replacements, tmpl.tmplVar, fmt.Sprintf("%f", metricVal))
 		}
 	} else {
 		for _, tmpl := range templateReplace {
-			html = strings.Replace(html, tmpl.tmplVar, "0", -1)
+			replacements = append(replacements, tmpl.tmplVar, "0")
 		}
 	}
 
@@ -335,7 +336,7 @@ func (m *metricsFromCSV) getHTML(metadata Metadata) (html string, err error) {
 		if seriesBytes, err = json.Marshal(series); err != nil {
 			return
 		}
-		html = strings.Replace(html, tmpl.tmplVar, string(seriesBytes), -1)
+		replacements = append(replacements, tmpl.tmplVar, string(seriesBytes))
 	}
 	// All Metrics Tab
 	var metricHTMLStats [][]string
@@ -352,35 +353,33 @@ func (m *metricsFromCSV) getHTML(metadata Metadata) (html string, err error) {
 	if jsonMetricsBytes, err = json.Marshal(metricHTMLStats); err != nil {
 		return
 	}
-	jsonMetrics := string(jsonMetricsBytes)
-	html = strings.Replace(html, "ALLMETRICS", string(jsonMetrics), -1)
+	replacements = append(replacements, "ALLMETRICS", string(jsonMetricsBytes))
 	// System Information Tab
 	jsonMetadata, err := metadata.JSON()
 	if err != nil {
 		return
 	}
-	html = strings.Replace(html, "METADATA", string(jsonMetadata), -1)
+	replacements = append(replacements, "METADATA", string(jsonMetadata))
+	html = strings.NewReplacer(replacements...).Replace(string(htmlTemplate))
 	return
 }
 
 // getCSV - generate CSV string representing the summary statistics of the metrics
-func (m *metricsFromCSV) getCSV(includeFieldNames bool) (out string, err error) {
-	var stats map[string]metricStats
-	if stats, err = m.getStats(); err != nil {
-		return
-	}
+func (m *metricsFromCSV) getCSV(stats map[string]metricStats, includeFieldNames bool) (out string) {
+	var sb strings.Builder
 	if includeFieldNames {
-		out = "metric,mean,min,max,stddev\n"
 		if m.groupByField != "" {
-			out = m.groupByField + "," + out
+			sb.WriteString(m.groupByField + ",")
 		}
+		sb.WriteString("metric,mean,min,max,stddev\n")
 	}
 	for _, name := range m.names {
 		if m.groupByValue == "" {
-			out += fmt.Sprintf("%s,%f,%f,%f,%f\n", name, stats[name].mean, stats[name].min, stats[name].max, stats[name].stddev)
+			fmt.Fprintf(&sb, "%s,%f,%f,%f,%f\n", name, stats[name].mean, stats[name].min, stats[name].max, stats[name].stddev)
 		} else {
-			out += fmt.Sprintf("%s,%s,%f,%f,%f,%f\n", m.groupByValue, name, stats[name].mean, stats[name].min, stats[name].max, stats[name].stddev)
+			fmt.Fprintf(&sb, "%s,%s,%f,%f,%f,%f\n", m.groupByValue, name, stats[name].mean, stats[name].min, stats[name].max, stats[name].stddev)
 		}
 	}
+	out = sb.String()
 	return
 }
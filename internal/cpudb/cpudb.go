@@ -15,6 +15,35 @@ import (
 
 type CPUDB []CPU
 
+// cpuRegexes - the model and stepping patterns of the built-in CPU table, compiled once
+var cpuRegexes = compileCPURegexes(cpus)
+
+// compileCPURegexes compiles the model and stepping patterns of the given CPUs, keyed by pattern
+func compileCPURegexes(db CPUDB) map[string]*regexp.Regexp {
+	regexes := make(map[string]*regexp.Regexp)
+	for _, info := range db {
+		for _, pattern := range []string{info.Model, info.Stepping} {
+			if _, ok := regexes[pattern]; ok || pattern == "" {
+				continue
+			}
+			// invalid patterns are left out so that GetCPUExtended reports the compile error
+			if re, err := regexp.Compile(pattern); err == nil {
+				regexes[pattern] = re
+			}
+		}
+	}
+	return regexes
+}
+
+// getRegex returns the precompiled regex for the given pattern, compiling it if it isn't in
+// the built-in CPU table
+func getRegex(pattern string) (*regexp.Regexp, error) {
+	if re, ok := cpuRegexes[pattern]; ok {
+		return re, nil
+	}
+	return regexp.Compile(pattern)
+}
+
 // NewCPUDB initializes the CPUDB structure with the yaml and returns it
 func NewCPUDB() *CPUDB {
 	return &cpus
@@ -38,7 +67,7 @@ func (c *CPUDB) GetCPUExtended(family, model, stepping, capid4, sockets, devices
 		// if family matches
 		if info.Family == family {
 			var reModel *regexp.Regexp
-			reModel, err = regexp.Compile(info.Model)
+			reModel, err = getRegex(info.Model)
 			if err != nil {
 				return
 			}
@@ -47,7 +76,7 @@ func (c *CPUDB) GetCPUExtended(family, model, stepping, capid4, sockets, devices
 				// if there is a stepping
 				if info.Stepping != "" {
 					var reStepping *regexp.Regexp
-					reStepping, err = regexp.Compile(info.Stepping)
+					reStepping, err = getRegex(info.Stepping)
 					if err != nil {
 						return
 					}
@@ -82,17 +111,19 @@ func (c *CPUDB) GetCPUByMicroArchitecture(uarch string) (cpu CPU, err error) {
 
 func (c *CPUDB) getSpecificCPU(family, model, capid4, sockets, devices string) (cpu CPU, err error) {
 	if family == "6" && model == "143" { // SPR
-		cpu, err = c.getSPRCPU(capid4)
+		cpu, err = c.getCapid4CPU("SPR", capid4)
 	} else if family == "6" && model == "207" { // EMR
-		cpu, err = c.getEMRCPU(capid4)
+		cpu, err = c.getCapid4CPU("EMR", capid4)
 	} else if family == "6" && model == "173" { // GNR
 		cpu, err = c.getGNRCPU(sockets, devices)
 	}
 	return
 }
 
-func (c *CPUDB) getSPRCPU(capid4 string) (cpu CPU, err error) {
-	var uarch string
+// getCapid4CPU - SPR and EMR share the same CAPID4 encoding of the die configuration,
+// so uarch is the base microarchitecture name, e.g., "SPR", that gets the _XCC or _MCC suffix
+func (c *CPUDB) getCapid4CPU(uarch string, capid4 string) (cpu CPU, err error) {
+	baseUarch := uarch
 	if capid4 != "" {
 		var bits int64
 		var capid4Int int64
@@ -102,50 +133,18 @@ func (c *CPUDB) getSPRCPU(capid4 string) (cpu CPU, err error) {
 		}
 		bits = (capid4Int >> 6) & 0b11
 		if bits == 3 {
-			uarch = "SPR_XCC"
+			uarch = baseUarch + "_XCC"
 		} else if bits == 1 {
-			uarch = "SPR_MCC"
-		}
-	}
-	if uarch == "" {
-		uarch = "SPR"
-	}
-	for _, info := range *c {
-		if info.MicroArchitecture == uarch {
-			cpu = info
-			return
+			uarch = baseUarch + "_MCC"
 		}
 	}
-	err = fmt.Errorf("did not find matching SPR architecture in CPU database: %s", uarch)
-	return
-}
-
-func (c *CPUDB) getEMRCPU(capid4 string) (cpu CPU, err error) {
-	var uarch string
-	if capid4 != "" {
-		var bits int64
-		var capid4Int int64
-		capid4Int, err = strconv.ParseInt(capid4, 16, 64)
-		if err != nil {
-			return
-		}
-		bits = (capid4Int >> 6) & 0b11
-		if bits == 3 {
-			uarch = "EMR_XCC"
-		} else if bits == 1 {
-			uarch = "EMR_MCC"
-		}
-	}
-	if uarch == "" {
-		uarch = "EMR"
-	}
 	for _, info := range *c {
 		if info.MicroArchitecture == uarch {
 			cpu = info
 			return
 		}
 	}
-	err = fmt.Errorf("did not find matching EMR architecture in CPU database: %s", uarch)
+	err = fmt.Errorf("did not find matching %s architecture in CPU database: %s", baseUarch, uarch)
 	return
 }
 
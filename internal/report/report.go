@@ -495,7 +495,8 @@ func CreateRawReport(tableNames []string, scriptOutputs map[string]script.Script
 		TableNames:    tableNames,
 		ScriptOutputs: scriptOutputs,
 	}
-	out, err = json.MarshalIndent(report, "", " ")
+	// not indented, raw reports are read back by ReadRawReports
+	out, err = json.Marshal(report)
 	return
 }
 
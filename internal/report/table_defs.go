@@ -1693,7 +1693,7 @@ func memoryLatencyTableValues(outputs map[string]script.ScriptOutput) []Field {
 		latency := latencyBandwidth[0]
 		bandwidth, err := strconv.ParseFloat(latencyBandwidth[1], 32)
 		if err != nil {
-			slog.Error(fmt.Sprintf("Unable to convert bandwidth to float: %s", latencyBandwidth[1]))
+			slog.Error("unable to convert bandwidth to float", slog.String("bandwidth", latencyBandwidth[1]))
 			continue
 		}
 		// insert into beginning of list
@@ -1723,13 +1723,13 @@ func numaBandwidthTableValues(outputs map[string]script.ScriptOutput) []Field {
 		fields[0].Values = append(fields[0].Values, nodeBandwidthsPair[0])
 		bandwidths := strings.Split(strings.TrimSpace(nodeBandwidthsPair[1]), "\t")
 		if len(bandwidths) != len(nodeBandwidthsPairs) {
-			slog.Warn(fmt.Sprintf("Mismatched number of bandwidths for numa node %s, %s", nodeBandwidthsPair[0], nodeBandwidthsPair[1]))
+			slog.Warn("mismatched number of bandwidths for numa node", slog.String("node", nodeBandwidthsPair[0]), slog.String("bandwidths", nodeBandwidthsPair[1]))
 			return []Field{}
 		}
 		for i, bw := range bandwidths {
 			val, err := strconv.ParseFloat(bw, 64)
 			if err != nil {
-				slog.Error(fmt.Sprintf("Unable to convert bandwidth to float: %s", bw))
+				slog.Error("unable to convert bandwidth to float", slog.String("bandwidth", bw))
 				continue
 			}
 			fields[i+1].Values = append(fields[i+1].Values, fmt.Sprintf("%.1f", val/1000))
@@ -1954,42 +1954,36 @@ func kernelLockAnalysisTableValues(outputs map[string]script.ScriptOutput) []Fie
 
 func instructionMixTableValues(outputs map[string]script.ScriptOutput) []Field {
 	// first two lines are not part of the CSV output, they are the start time and interval
-	var startTime time.Time
-	var interval int
-	for i, line := range strings.Split(outputs[script.InstructionMixScriptName].Stdout, "\n") {
-		if i == 0 {
-			if !strings.HasPrefix(line, "TIME") {
-				slog.Error("instruction mix output is not in expected format, missing TIME")
-				return []Field{}
-			} else {
-				val := strings.Split(line, " ")[1]
-				var err error
-				startTime, err = time.Parse("15:04:05", val)
-				if err != nil {
-					slog.Error(fmt.Sprintf("unable to parse instruction mix start time: %s", val))
-					return []Field{}
-				}
-			}
-		} else if i == 1 {
-			if !strings.HasPrefix(line, "INTERVAL") {
-				slog.Error("instruction mix output is not in expected format, missing INTERVAL")
-				return []Field{}
-			} else {
-				val := strings.Split(line, " ")[1]
-				var err error
-				interval, err = strconv.Atoi(val)
-				if err != nil {
-					slog.Error(fmt.Sprintf("unable to convert instruction mix interval to int: %s", val))
-					return []Field{}
-				}
-			}
-		} else {
-			break
-		}
+	// split off only those two lines, the rest is handed to the CSV reader as is
+	lines := strings.SplitN(outputs[script.InstructionMixScriptName].Stdout, "\n", 3)
+	if len(lines) < 3 {
+		slog.Error("instruction mix output is not in expected format")
+		return []Field{}
+	}
+	timeField, found := strings.CutPrefix(lines[0], "TIME:")
+	if !found {
+		slog.Error("instruction mix output is not in expected format, missing TIME")
+		return []Field{}
+	}
+	timeVal := strings.TrimSpace(timeField)
+	startTime, err := time.Parse("15:04:05", timeVal)
+	if err != nil {
+		slog.Error("unable to parse instruction mix start time", slog.String("time", timeVal))
+		return []Field{}
+	}
+	intervalField, found := strings.CutPrefix(lines[1], "INTERVAL:")
+	if !found {
+		slog.Error("instruction mix output is not in expected format, missing INTERVAL")
+		return []Field{}
+	}
+	intervalVal := strings.TrimSpace(intervalField)
+	interval, err := strconv.Atoi(intervalVal)
+	if err != nil {
+		slog.Error("unable to convert instruction mix interval to int", slog.String("interval", intervalVal))
+		return []Field{}
 	}
 	// parse the CSV output
-	csvOutput := strings.Join(strings.Split(outputs[script.InstructionMixScriptName].Stdout, "\n")[2:], "\n")
-	r := csv.NewReader(strings.NewReader(csvOutput))
+	r := csv.NewReader(strings.NewReader(lines[2]))
 	rows, err := r.ReadAll()
 	if err != nil {
 		slog.Error(err.Error())
@@ -2016,7 +2010,7 @@ func instructionMixTableValues(outputs map[string]script.ScriptOutput) []Field {
 		}
 		rowSample, err := strconv.Atoi(row[0])
 		if err != nil {
-			slog.Error(fmt.Sprintf("unable to convert instruction mix sample to int: %s", row[0]))
+			slog.Error("unable to convert instruction mix sample to int", slog.String("sample", row[0]))
 			continue
 		}
 		if rowSample != sample { // new sample
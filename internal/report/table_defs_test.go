@@ -0,0 +1,56 @@
+package report
+
+// Copyright (C) 2021-2024 Intel Corporation
+// SPDX-License-Identifier: BSD-3-Clause
+
+import (
+	"testing"
+
+	"perfspect/internal/script"
+)
+
+func TestInstructionMixTableValues(t *testing.T) {
+	// header lines as printed by the instruction mix script, followed by processwatch CSV output
+	stdout := "TIME: 10:20:30\n" +
+		"INTERVAL: 2\n" +
+		"interval,pid,name,SSE,AVX\n" +
+		"0,100,app,1.5,2.5\n" +
+		"0,200,other,3.5,4.5\n" +
+		"1,100,app,5.5,6.5\n"
+	outputs := map[string]script.ScriptOutput{
+		script.InstructionMixScriptName: {Stdout: stdout},
+	}
+	fields := instructionMixTableValues(outputs)
+	expected := []Field{
+		{Name: "Time", Values: []string{"10:20:30", "10:20:32"}},
+		{Name: "SSE", Values: []string{"1.5", "5.5"}},
+		{Name: "AVX", Values: []string{"2.5", "6.5"}},
+	}
+	if len(fields) != len(expected) {
+		t.Fatalf("expected %d fields, got %d: %v", len(expected), len(fields), fields)
+	}
+	for i, field := range fields {
+		if field.Name != expected[i].Name {
+			t.Errorf("field %d: expected name %s, got %s", i, expected[i].Name, field.Name)
+		}
+		if len(field.Values) != len(expected[i].Values) {
+			t.Errorf("field %s: expected values %v, got %v", field.Name, expected[i].Values, field.Values)
+			continue
+		}
+		for j, value := range field.Values {
+			if value != expected[i].Values[j] {
+				t.Errorf("field %s: expected values %v, got %v", field.Name, expected[i].Values, field.Values)
+				break
+			}
+		}
+	}
+}
+
+func TestInstructionMixTableValuesMissingHeader(t *testing.T) {
+	outputs := map[string]script.ScriptOutput{
+		script.InstructionMixScriptName: {Stdout: "interval,pid,name,SSE\n0,100,app,1.5\n"},
+	}
+	if fields := instructionMixTableValues(outputs); len(fields) != 0 {
+		t.Errorf("expected no fields, got %v", fields)
+	}
+}
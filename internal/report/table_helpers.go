@@ -1483,18 +1483,15 @@ func expandCPUList(cpuList string) (cpus []int) {
 	if cpuList != "" {
 		tokens := strings.Split(cpuList, ",")
 		for _, token := range tokens {
-			if strings.Contains(token, "-") {
-				subTokens := strings.Split(token, "-")
-				if len(subTokens) == 2 {
-					begin, errA := strconv.Atoi(subTokens[0])
-					end, errB := strconv.Atoi(subTokens[1])
-					if errA != nil || errB != nil {
-						slog.Warn("Failed to parse CPU affinity", slog.String("cpuList", cpuList))
-						return
-					}
-					for i := begin; i <= end; i++ {
-						cpus = append(cpus, i)
-					}
+			if beginToken, endToken, isRange := strings.Cut(token, "-"); isRange {
+				begin, errA := strconv.Atoi(beginToken)
+				end, errB := strconv.Atoi(endToken)
+				if errA != nil || errB != nil {
+					slog.Warn("Failed to parse CPU affinity", slog.String("cpuList", cpuList))
+					return
+				}
+				for i := begin; i <= end; i++ {
+					cpus = append(cpus, i)
 				}
 			} else {
 				cpu, err := strconv.Atoi(token)
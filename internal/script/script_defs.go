@@ -655,28 +655,28 @@ done`,
 		},
 		{
 			Name:          PMUDriverVersionScriptName,
-			Script:        `dmesg | grep -A 1 "Intel PMU driver" | tail -1 | awk '{print $NF}'`,
+			Script:        `dmesg | awk '/Intel PMU driver/ {getline; version=$NF} END {print version}'`,
 			Superuser:     true,
 			Architectures: []string{x86_64},
 			Families:      []string{"6"}, // Intel
 		},
 		{
 			Name: PMUBusyScriptName,
-			Script: `# loop through the PMU counters and check if they are active or inactive
-for i in 0x30a 0x309 0x30b 0x30c 0xc1 0xc2 0xc3 0xc4 0xc5 0xc6 0xc7 0xc8; do
-    arr=()
-    # read the value of the msr represented by the hex value 6 times, save results in an array
-    for j in {1..6}; do
-        val=$(rdmsr $i | tr -d '\n')
-        # if the value isn't a hex value, go on to next hex value
-        if [[ ! $val =~ ^[0-9a-fA-F]+$ ]]; then
-            echo "$i Unknown"
-            continue 2
-        fi
-        arr+=($val)
-    done
-    # if the first and last value in the array are the same, the counter is inactive
-    if [ ${arr[0]} == ${arr[5]} ]; then
+			Script: `# sample all PMU counters twice and check if they are active or inactive
+msrs=(0x30a 0x309 0x30b 0x30c 0xc1 0xc2 0xc3 0xc4 0xc5 0xc6 0xc7 0xc8)
+declare -A first
+for i in "${msrs[@]}"; do
+    first[$i]=$(rdmsr $i)
+done
+# a short gap between sweeps is enough for a counter in use to change
+sleep 0.1
+for i in "${msrs[@]}"; do
+    val=$(rdmsr $i)
+    # if either value isn't a hex value, the counter state is unknown
+    if [[ ! ${first[$i]} =~ ^[0-9a-fA-F]+$ || ! $val =~ ^[0-9a-fA-F]+$ ]]; then
+        echo "$i Unknown"
+    # if the first and last value are the same, the counter is inactive
+    elif [ "${first[$i]}" == "$val" ]; then
         echo "$i Inactive"
     else
         echo "$i Active"
@@ -712,7 +712,7 @@ done`,
 			Script: `# measure memory loaded latency
 #  need at least 2 GB (2,097,152 KB) of huge pages per NUMA node
 min_kb=2097152
-numa_nodes=$( lscpu | grep "NUMA node(s):" | awk '{print $3}' )
+numa_nodes=$( ls -d /sys/devices/system/node/node[0-9]* | wc -l )
 size_huge_pages_kb=$( grep Hugepagesize /proc/meminfo | awk '{print $2}' )
 orig_num_huge_pages=$( cat /proc/sys/vm/nr_hugepages )
 needed_num_huge_pages=$((numa_nodes * min_kb / size_huge_pages_kb))
@@ -732,7 +732,7 @@ echo $orig_num_huge_pages > /proc/sys/vm/nr_hugepages`,
 			Script: `# measure memory bandwidth matrix
 #  need at least 2 GB (2,097,152 KB) of huge pages per NUMA node
 min_kb=2097152
-numa_nodes=$( lscpu | grep "NUMA node(s):" | awk '{print $3}' )
+numa_nodes=$( ls -d /sys/devices/system/node/node[0-9]* | wc -l )
 size_huge_pages_kb=$( grep Hugepagesize /proc/meminfo | awk '{print $2}' )
 orig_num_huge_pages=$( cat /proc/sys/vm/nr_hugepages )
 needed_num_huge_pages=$((numa_nodes * min_kb / size_huge_pages_kb))
@@ -12,6 +12,8 @@ import (
 	"perfspect/internal/target"
 )
 
+var coreCountRegex = regexp.MustCompile("Core Count: [0-9]+")
+
 func TestRunScript(t *testing.T) {
 	var targets []target.Target
 	// targets = append(targets, target.NewRemoteTarget("", "emr", "", "", "", "", "../../tools/bin/sshpass", ""))
@@ -83,8 +85,7 @@ echo "Core Count: $num_cores_per_socket"`,
 				t.Fatalf("unexpected error: %v", err)
 			}
 
-			re := regexp.MustCompile("Core Count: [0-9]+")
-			if !re.MatchString(scriptOutput.Stdout) {
+			if !coreCountRegex.MatchString(scriptOutput.Stdout) {
 				t.Errorf("unexpected stdout: got %q, want %q", scriptOutput.Stdout, "Core Count: [0-9]+")
 			}
 
@@ -146,8 +147,7 @@ mpstat -u -T -I SCPU -P ALL 1 $count`,
 			if scriptOutputs["unittest hello"].Stdout != expectedStdout {
 				t.Errorf("unexpected stdout: got %q, want %q", scriptOutputs["unittest hello"].Stdout, expectedStdout)
 			}
-			re = regexp.MustCompile("Core Count: [0-9]+")
-			if !re.MatchString(scriptOutput.Stdout) {
+			if !coreCountRegex.MatchString(scriptOutput.Stdout) {
 				t.Errorf("unexpected stdout: got %q, want %q", scriptOutput.Stdout, "Core Count: [0-9]+")
 			}
 		}
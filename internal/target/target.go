@@ -240,42 +240,42 @@ func (t *RemoteTarget) GetArchitecture() (arch string, err error) {
 
 func (t *LocalTarget) GetFamily() (family string, err error) {
 	if t.family == "" {
-		t.family, err = getFamily(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.family, err
 }
 
 func (t *RemoteTarget) GetFamily() (family string, err error) {
 	if t.family == "" {
-		t.family, err = getFamily(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.family, err
 }
 
 func (t *LocalTarget) GetModel() (family string, err error) {
 	if t.model == "" {
-		t.model, err = getModel(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.model, err
 }
 
 func (t *RemoteTarget) GetModel() (family string, err error) {
 	if t.model == "" {
-		t.model, err = getModel(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.model, err
 }
 
 func (t *LocalTarget) GetStepping() (stepping string, err error) {
 	if t.stepping == "" {
-		t.stepping, err = getStepping(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.stepping, err
 }
 
 func (t *RemoteTarget) GetStepping() (stepping string, err error) {
 	if t.stepping == "" {
-		t.stepping, err = getStepping(t)
+		t.family, t.model, t.stepping, err = getCPUIdentification(t)
 	}
 	return t.stepping, err
 }
@@ -781,33 +781,56 @@ func getArchitecture(t Target) (arch string, err error) {
 	return
 }
 
-func getFamily(t Target) (family string, err error) {
-	cmd := exec.Command("bash", "-c", "lscpu | grep -i \"^CPU family:\" | awk '{print $NF}'")
-	family, _, _, err = t.RunCommand(cmd, 0, true)
-	if err != nil {
-		return
+// getCPUIdentification - reads the family, model, and stepping from the first CPU in
+// /proc/cpuinfo, falling back to lscpu when cpuinfo doesn't have them (e.g., on ARM), so
+// that the three values are cached together
+func getCPUIdentification(t Target) (family string, model string, stepping string, err error) {
+	// patterns are plain words so that the command survives being flattened by ssh,
+	// the first CPU's entry has four matching lines: cpu family, model, model name, stepping
+	cmd := exec.Command("grep", "-m", "4", "-e", "family", "-e", "model", "-e", "stepping", "/proc/cpuinfo")
+	stdout, _, _, grepErr := t.RunCommand(cmd, 0, true)
+	if grepErr == nil {
+		family, model, stepping = parseCPUIdentification(stdout)
+		if family != "" && model != "" && stepping != "" {
+			return
+		}
 	}
-	family = strings.TrimSpace(family)
-	return
-}
-
-func getModel(t Target) (model string, err error) {
-	cmd := exec.Command("bash", "-c", "lscpu | grep -i model: | awk '{print $NF}'")
-	model, _, _, err = t.RunCommand(cmd, 0, true)
+	cmd = exec.Command("lscpu")
+	stdout, _, _, err = t.RunCommand(cmd, 0, true)
 	if err != nil {
 		return
 	}
-	model = strings.TrimSpace(model)
+	family, model, stepping = parseCPUIdentification(stdout)
 	return
 }
 
-func getStepping(t Target) (stepping string, err error) {
-	cmd := exec.Command("bash", "-c", "lscpu | grep -i stepping: | awk '{print $NF}'")
-	stepping, _, _, err = t.RunCommand(cmd, 0, true)
-	if err != nil {
-		return
+// parseCPUIdentification - parses the family, model, and stepping from /proc/cpuinfo or
+// lscpu formatted output, i.e., "key: value" lines
+func parseCPUIdentification(output string) (family string, model string, stepping string) {
+	for _, line := range strings.Split(output, "\n") {
+		key, value, found := strings.Cut(line, ":")
+		if !found {
+			continue
+		}
+		fields := strings.Fields(value)
+		if len(fields) == 0 {
+			continue
+		}
+		switch strings.ToLower(strings.TrimSpace(key)) {
+		case "cpu family":
+			if family == "" {
+				family = fields[len(fields)-1]
+			}
+		case "model":
+			if model == "" {
+				model = fields[len(fields)-1]
+			}
+		case "stepping":
+			if stepping == "" {
+				stepping = fields[len(fields)-1]
+			}
+		}
 	}
-	stepping = strings.TrimSpace(stepping)
 	return
 }
 
@@ -17,3 +17,16 @@ func TestNew(t *testing.T) {
 		t.Fatal("failed to create a remote target")
 	}
 }
+
+func TestParseCPUIdentification(t *testing.T) {
+	cpuinfo := "cpu family\t: 6\nmodel\t\t: 143\nmodel name\t: Intel(R) Xeon(R) Platinum 8480+\nstepping\t: 8\n"
+	family, model, stepping := parseCPUIdentification(cpuinfo)
+	if family != "6" || model != "143" || stepping != "8" {
+		t.Fatalf("unexpected cpuinfo identification: %s, %s, %s", family, model, stepping)
+	}
+	lscpu := "Vendor ID:               GenuineIntel\n  Model name:            Intel(R) Xeon(R) Platinum 8480+\n    CPU family:          6\n    Model:               143\n    Stepping:            8\n"
+	family, model, stepping = parseCPUIdentification(lscpu)
+	if family != "6" || model != "143" || stepping != "8" {
+		t.Fatalf("unexpected lscpu identification: %s, %s, %s", family, model, stepping)
+	}
+}
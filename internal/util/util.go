@@ -10,7 +10,6 @@ import (
 	"archive/tar"
 	"compress/gzip"
 	"embed"
-	"encoding/binary"
 	"fmt"
 	"io"
 	"io/fs"
@@ -99,11 +98,16 @@ func CopyDirectory(scrDir, dest string) error {
 	for _, entry := range entries {
 		sourcePath := filepath.Join(scrDir, entry.Name())
 		destPath := filepath.Join(dest, entry.Name())
-		fileInfo, err := os.Stat(sourcePath)
-		if err != nil {
-			return err
+		// only symlinks need a stat to resolve the type of their target
+		fileMode := entry.Type()
+		if fileMode&os.ModeSymlink != 0 {
+			fileInfo, err := os.Stat(sourcePath)
+			if err != nil {
+				return err
+			}
+			fileMode = fileInfo.Mode()
 		}
-		if fileInfo.Mode().IsDir() {
+		if fileMode.IsDir() {
 			// Create the subdirectory in the destination directory
 			if err := CreateIfNotExists(destPath, 0755); err != nil {
 				return err
@@ -112,7 +116,7 @@ func CopyDirectory(scrDir, dest string) error {
 			if err := CopyDirectory(sourcePath, destPath); err != nil {
 				return err
 			}
-		} else if fileInfo.Mode().IsRegular() {
+		} else if fileMode.IsRegular() {
 			// Copy the file to the destination directory
 			if err := Copy(sourcePath, destPath); err != nil {
 				return err
@@ -167,11 +171,8 @@ func Exists(filePath string) bool {
 
 // CreateIfNotExists creates a directory at the specified path if it does not already exist.
 // If the directory already exists, it does nothing and returns nil.
-// If there is an error while creating the directory, it returns an error with a descriptive message.
+// If there is an error while creating the directory, e.g., the path is a file, it returns an error with a descriptive message.
 func CreateIfNotExists(dir string, perm os.FileMode) error {
-	if Exists(dir) {
-		return nil
-	}
 	if err := os.MkdirAll(dir, perm); err != nil {
 		return fmt.Errorf("failed to create directory: '%s', error: '%s'", dir, err.Error())
 	}
@@ -254,7 +255,7 @@ func ExtractResource(resources embed.FS, resourcePath string, tempDir string) (s
 			return "", err
 		}
 		defer f.Close()
-		err = binary.Write(f, binary.LittleEndian, resourceBytes)
+		_, err = f.Write(resourceBytes)
 		if err != nil {
 			return "", err
 		}
@@ -272,6 +273,8 @@ func UniqueAppend(slice []string, item string) []string {
 	return append(slice, item)
 }
 
+var versionRegex = regexp.MustCompile(`(\d+)\.(\d+)\.(\d+)[-]?(alpha|beta|rc)?[\.]?(\d+)?`)
+
 // CompareVersions compares two version strings
 // version format: major.minor.patch<-alpha|beta|rc><.build>
 // examples: 1.2.3, 1.2.3-alpha.4
@@ -281,12 +284,11 @@ func UniqueAppend(slice []string, item string) []string {
 // 1 if v1 is greater than v2
 // An error if the version strings are not valid
 func CompareVersions(v1, v2 string) (int, error) {
-	re := regexp.MustCompile(`(\d+)\.(\d+)\.(\d+)[-]?(alpha|beta|rc)?[\.]?(\d+)?`)
-	v1Parts := re.FindStringSubmatch(v1)
+	v1Parts := versionRegex.FindStringSubmatch(v1)
 	if v1Parts == nil {
 		return 0, fmt.Errorf("error: unable to parse version string: %s", v1)
 	}
-	v2Parts := re.FindStringSubmatch(v2)
+	v2Parts := versionRegex.FindStringSubmatch(v2)
 	if v2Parts == nil {
 		return 0, fmt.Errorf("error: unable to parse version string: %s", v2)
 	}
@@ -3,7 +3,11 @@ package util
 // Copyright (C) 2021-2024 Intel Corporation
 // SPDX-License-Identifier: BSD-3-Clause
 
-import "testing"
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
 
 func TestCompareVersions(t *testing.T) {
 	tests := []struct {
@@ -32,3 +36,46 @@ func TestCompareVersions(t *testing.T) {
 		}
 	}
 }
+
+func TestCopyDirectory(t *testing.T) {
+	src := t.TempDir()
+	dst := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(src, "a", "b"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.WriteFile(filepath.Join(src, "a", "b", "file.txt"), []byte("data"), 0640); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Symlink(filepath.Join(src, "a", "b", "file.txt"), filepath.Join(src, "link.txt")); err != nil {
+		t.Fatal(err)
+	}
+	if err := CopyDirectory(src, dst); err != nil {
+		t.Fatalf("failed to copy directory: %v", err)
+	}
+	for _, path := range []string{filepath.Join(dst, "a", "b", "file.txt"), filepath.Join(dst, "link.txt")} {
+		data, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatalf("failed to read copied file: %v", err)
+		}
+		if string(data) != "data" {
+			t.Errorf("unexpected contents in %s: %s", path, data)
+		}
+	}
+}
+
+func TestCreateIfNotExists(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "a", "b")
+	// create, then call again on the existing directory
+	for i := 0; i < 2; i++ {
+		if err := CreateIfNotExists(dir, 0755); err != nil {
+			t.Fatalf("failed to create directory: %v", err)
+		}
+	}
+	file := filepath.Join(dir, "file.txt")
+	if err := os.WriteFile(file, []byte("data"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if err := CreateIfNotExists(file, 0755); err == nil {
+		t.Errorf("expected an error when the path is a file")
+	}
+}